@@ -1,14 +1,161 @@
-from re import match, M
-from typing import Tuple, List, Optional, TYPE_CHECKING
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Tuple, List, Optional, Dict, Iterable, TYPE_CHECKING
 from meapi.api.raw.account import *
-from meapi.utils.validations import validate_contacts, validate_calls, validate_phone_number
+from meapi.utils.validations import validate_contacts, validate_calls, validate_phone_number, iter_valid_contacts
 from meapi.utils.exceptions import MeApiException, MeException
-from meapi.utils.helpers import generate_random_data, _register_new_account, _upload_picture
+from meapi.utils.helpers import generate_random_data, _register_new_account, _upload_picture, get_img_binary_contents
 from meapi.models import contact, profile, call, blocked_number, user
+from meapi.models.common import _build_vcard
 if TYPE_CHECKING:  # always False at runtime.
     from meapi import Me
 
 
+class _Unset:
+    """Type of the ``_UNSET`` default: tells a parameter that was not passed apart from ``None``."""
+    def __repr__(self):
+        return 'UNSET'
+
+
+_UNSET = _Unset()
+_EMAIL_BAD_CHARS = frozenset('<>()[]\\.,;:@" \t\n\r\f\v')
+_DIGITS_RE = re.compile(r'\d+')
+_PROFILE_FIELDS = ('first_name', 'last_name', 'email', 'gender', 'slogan', 'profile_picture', 'date_of_birth',
+                   'location_name', 'carrier', 'device_type', 'login_type', 'facebook_url', 'google_url')
+_GENDERS = {'M': 'M', 'm': 'M', 'F': 'F', 'f': 'F', None: None}
+_DEVICE_TYPES = frozenset(('android', 'ios'))
+_LOGIN_TYPES = frozenset(('email', 'apple'))
+_BULK_CHUNK_SIZE = 500  # max phone numbers to send in one bulk-block/unblock request
+_BULK_MAX_WORKERS = 4
+
+
+def _is_valid_email(email: str) -> bool:
+    """
+    Internal function to check that ``email`` is in ``user@domain.com`` format.
+        - Linear string checks instead of a backtracking regex, so long inputs can't hang the validation.
+    """
+    local, sep, domain = email.rpartition('@')
+    if not sep or not local:
+        return False
+    labels = domain.split('.')
+    if len(labels) < 2 or len(labels[-1]) < 2 or not all(label and _EMAIL_BAD_CHARS.isdisjoint(label) for label in labels):
+        return False
+    if len(local) > 2 and local[0] == local[-1] == '"':  # quoted local part, anything goes.
+        return True
+    return all(part and _EMAIL_BAD_CHARS.isdisjoint(part) for part in local.split('.'))
+
+
+def _check_device_type(client: 'Me', key: str, value: Optional[str]) -> Optional[str]:
+    if value is not None and (not isinstance(value, str) or value not in _DEVICE_TYPES):
+        raise MeException("Device type not in the available device types (android, ios, None)!")
+    return value
+
+
+def _check_date_of_birth(client: 'Me', key: str, value: Optional[str]) -> Optional[str]:
+    if value is not None:
+        try:  # strptime also accepts '2000-1-5', send the zero-padded date.
+            return datetime.strptime(str(value), '%Y-%m-%d').date().isoformat()
+        except ValueError:
+            raise MeException("Birthday must be in YYYY-MM-DD format!")
+    return value
+
+
+def _check_numeric_id(client: 'Me', key: str, value: Union[str, int, None]) -> Union[str, int, None]:
+    if value is not None and not _DIGITS_RE.fullmatch(str(value)):
+        raise MeException(f"{key} must be numbers!")
+    return value
+
+
+def _check_profile_picture(client: 'Me', key: str, value: Optional[str]) -> Optional[str]:
+    if value is not None:
+        if not isinstance(value, str):
+            raise MeException("profile_picture_url must be a url or path to a file!")
+        value = str(_upload_picture(client, **{'image': value}))
+    return value
+
+
+def _check_gender(client: 'Me', key: str, value: Optional[str]) -> Optional[str]:
+    try:
+        return _GENDERS[value]
+    except (KeyError, TypeError):
+        raise MeException("Gender must be: 'F' for Female, 'M' for Male, and 'None' for null.")
+
+
+def _check_text(client: 'Me', key: str, value: Optional[str]) -> Optional[str]:
+    if value is not None and not isinstance(value, str):
+        raise MeException(f"{key} value must be a string or None!")
+    return value
+
+
+def _check_email(client: 'Me', key: str, value: Optional[str]) -> Optional[str]:
+    if value is not None and not (isinstance(value, str) and 5 < len(value) <= 320 and _is_valid_email(value)):
+        raise MeException("Email must be in user@domain.com format!")
+    return value
+
+
+def _check_login_type(client: 'Me', key: str, value: Optional[str]) -> Optional[str]:
+    if value is not None and (not isinstance(value, str) or value not in _LOGIN_TYPES):
+        raise MeException(f"{key} not in the available login types (email, apple, None)!")
+    return value
+
+
+# update_profile_details validators by field. each one gets (client, key, value), raises MeException
+# if the value is not valid, and returns the value to send.
+_PROFILE_VALIDATORS = {
+    'device_type': _check_device_type,
+    'date_of_birth': _check_date_of_birth,
+    'facebook_url': _check_numeric_id,
+    'google_url': _check_numeric_id,
+    'profile_picture': _check_profile_picture,
+    'gender': _check_gender,
+    'first_name': _check_text,
+    'last_name': _check_text,
+    'slogan': _check_text,
+    'location_name': _check_text,
+    'email': _check_email,
+    'login_type': _check_login_type,
+}
+
+
+def _profile_uuid(uuid: Union[str, contact.Contact, user.User, profile.Profile]) -> str:
+    """
+    Internal function to get the uuid of :py:func:`~meapi.Me.get_profile` argument.
+    """
+    if isinstance(uuid, str):  # the common case first
+        return uuid
+    if isinstance(uuid, (user.User, profile.Profile)):
+        return uuid.uuid
+    if isinstance(uuid, contact.Contact):
+        if not uuid.user:
+            raise MeException("Contact has no user.")
+        return uuid.user.uuid
+    raise MeException(f"Not a valid uuid: {uuid!r}")
+
+
+def _chunks(items: list, size: int = _BULK_CHUNK_SIZE) -> List[list]:
+    """
+    Internal function to split list to chunks of ``size`` items.
+    """
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _validate_numbers(numbers: Union[int, str, List[Union[int, str]]]) -> List[int]:
+    """
+    Internal function to validate single or list of phone numbers before sending them.
+        - Raises :py:exc:`~meapi.utils.exceptions.MeException` on the first invalid number, without any api call.
+        - Returns the clean numbers, without duplicates.
+        - Raises :py:exc:`~meapi.utils.exceptions.MeException` if there are no numbers, an empty request would report success.
+    """
+    if isinstance(numbers, (int, str)):
+        numbers = [numbers]
+    elif not isinstance(numbers, (list, tuple, set)):
+        raise MeException("numbers must be a phone number or a list of phone numbers!")
+    if not numbers:
+        raise MeException("You need to provide at least one phone number!")
+    return list(dict.fromkeys(validate_phone_number(number) for number in numbers))
+
+
 class Account:
     """
     This class is not intended to create an instance's but only to be inherited by ``Me``.
@@ -27,15 +174,41 @@ class Account:
         :return: :py:obj:`~meapi.models.contact.Contact` object or ``None`` if no user exists on the provided phone number.
         :rtype: :py:obj:`~meapi.models.contact.Contact` | ``None``
         """
-        try:
-            response = phone_search_raw(self, validate_phone_number(phone_number))
-        except MeApiException as err:
-            if err.http_status == 404 and err.msg == 'Not found.':
-                return None
-            else:
-                raise err
+        phone_number = validate_phone_number(phone_number)
+        response = self._search_cache.get(phone_number)
+        if response is None:
+            try:
+                response = phone_search_raw(self, phone_number)
+            except MeApiException as err:
+                if err.http_status == 404 and err.msg == 'Not found.':
+                    return None
+                else:
+                    raise err
+            self._search_cache.set(phone_number, response)
         return contact.Contact.new_from_dict(response['contact'], _client=self)
 
+    def phone_search_many(self: 'Me', phone_numbers: List[Union[str, int]], max_workers: int = 8) -> Dict[Union[str, int], Optional[contact.Contact]]:
+        """
+        Get information on many phone numbers at once.
+            - The searches are sent concurrently, so the total time is close to the time of the slowest search.
+            - Each phone number still counts against your daily search limit (See :py:func:`phone_search`).
+
+        :param phone_numbers: List of phone numbers in international format.
+        :type phone_numbers: List[``str`` | ``int``]
+        :param max_workers: Maximum number of searches to send at the same time. *Default:* ``8``.
+        :type max_workers: ``int``
+        :raises MeException: If one of the phone numbers is not valid, before any search is sent.
+        :raises MeApiException: msg: ``api_search_passed_limit`` if you passed the limit (About ``350`` per day in the unofficial auth method).
+        :return: Dict of each provided phone number and its :py:obj:`~meapi.models.contact.Contact` object, or ``None`` if no user exists on it.
+        :rtype: Dict[``str`` | ``int``, :py:obj:`~meapi.models.contact.Contact` | ``None``]
+        """
+        phone_numbers = list(phone_numbers)
+        numbers = [validate_phone_number(phone_number) for phone_number in phone_numbers]  # all of them, before any search
+        unique_numbers = list(dict.fromkeys(numbers))  # '+972...' and 972... cost one search
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = dict(zip(unique_numbers, executor.map(self.phone_search, unique_numbers)))
+        return {phone_number: results[number] for phone_number, number in zip(phone_numbers, numbers)}
+
     def get_profile(self: 'Me', uuid: Union[str, contact.Contact, user.User]) -> profile.Profile:
         """
         Get user's profile.
@@ -46,32 +219,52 @@ class Account:
 
         :param uuid: The user's UUID as ``str`` or :py:obj:`~meapi.models.contact.Contact` or :py:obj:`~meapi.models.user.User` objects.
         :type uuid: ``str`` | :py:obj:`~meapi.models.contact.Contact` | :py:obj:`~meapi.models.user.User`
+        :raises MeException: If ``uuid`` is not a ``str`` or a contact without user.
         :raises MeApiException: msg: ``api_profile_view_passed_limit`` if you passed the limit (About ``500`` per day in the unofficial auth method).
         :return: :py:obj:`~meapi.models.profile.Profile` object.
         :rtype: :py:obj:`~meapi.models.profile.Profile`
         """
-        if isinstance(uuid, contact.Contact):
-            if getattr(uuid, 'user', None):
-                uuid = uuid.user.uuid
-        if isinstance(uuid, user.User):
-            uuid = uuid.uuid
-        res = get_profile_raw(self, str(uuid))
+        uuid = _profile_uuid(uuid)
+        res = self._profile_cache.get(uuid)
+        if res is None:
+            res = get_profile_raw(self, uuid)
+            self._profile_cache.set(uuid, res)
+        res = dict(res)  # the cached response is shared, do not pop from it
         if uuid == self.uuid:
             res['_my_profile'] = True
         extra_profile = res.pop('profile')
         return profile.Profile.new_from_dict(res, _client=self, **extra_profile)
 
+    def get_profiles(self: 'Me', uuids: List[Union[str, contact.Contact, user.User]], max_workers: int = 8) -> Dict[str, profile.Profile]:
+        """
+        Get the profiles of many users at once.
+            - The requests are sent concurrently, so the total time is close to the time of the slowest request.
+            - Each profile still counts against your daily profile views limit (See :py:func:`get_profile`).
+
+        :param uuids: List of users UUIDs or :py:obj:`~meapi.models.contact.Contact` / :py:obj:`~meapi.models.user.User` objects, like :py:func:`get_profile`.
+        :type uuids: List[``str`` | :py:obj:`~meapi.models.contact.Contact` | :py:obj:`~meapi.models.user.User`]
+        :param max_workers: Maximum number of requests to send at the same time. *Default:* ``8``.
+        :type max_workers: ``int``
+        :raises MeException: If one of ``uuids`` is not valid or a contact without user, before any request is sent.
+        :raises MeApiException: msg: ``api_profile_view_passed_limit`` if you passed the limit (About ``500`` per day in the unofficial auth method).
+        :return: Dict of each uuid and its :py:obj:`~meapi.models.profile.Profile` object.
+        :rtype: Dict[``str``, :py:obj:`~meapi.models.profile.Profile`]
+        """
+        uuids = list(dict.fromkeys(_profile_uuid(uuid) for uuid in uuids))  # resolved before dedupe, a user and its uuid cost one request
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(uuids, executor.map(self.get_profile, uuids)))
+
     def get_my_profile(self: 'Me') -> profile.Profile:
         """
         Get your profile information.
+            - Served from the same short cache as :py:func:`get_profile`, which is cleared when you change your profile, settings or location.
 
         :return: :py:obj:`~meapi.models.profile.Profile` object.
         :rtype: :py:obj:`~meapi.models.profile.Profile`
         """
         if self.uuid:
-            res = get_profile_raw(self, self.uuid)
-        else:
-            res = get_my_profile_raw(self)
+            return self.get_profile(self.uuid)
+        res = get_my_profile_raw(self)
         try:
             extra = res.pop('profile')
         except KeyError:
@@ -92,6 +285,8 @@ class Account:
             if res and getattr(res, 'user', None):
                 return res.user.uuid
             return None
+        if self.uuid:  # self uuid, already known from the login
+            return self.uuid
         try:  # self uuid
             return get_my_profile_raw(self)['uuid']
         except MeApiException as err:
@@ -101,23 +296,23 @@ class Account:
                 raise err
 
     def update_profile_details(self: 'Me',
-                               first_name: str = False,
-                               last_name: str = False,
-                               email: str = False,
-                               gender: str = False,
-                               slogan: str = False,
-                               profile_picture: str = False,
-                               date_of_birth: str = False,
-                               location_name: str = False,
-                               carrier: str = False,
-                               device_type: str = False,
-                               login_type: str = False,
-                               facebook_url: str = False,
-                               google_url: str = False,
+                               first_name: Optional[str] = _UNSET,
+                               last_name: Optional[str] = _UNSET,
+                               email: Optional[str] = _UNSET,
+                               gender: Optional[str] = _UNSET,
+                               slogan: Optional[str] = _UNSET,
+                               profile_picture: Optional[str] = _UNSET,
+                               date_of_birth: Optional[str] = _UNSET,
+                               location_name: Optional[str] = _UNSET,
+                               carrier: Optional[str] = _UNSET,
+                               device_type: Optional[str] = _UNSET,
+                               login_type: Optional[str] = _UNSET,
+                               facebook_url: Optional[str] = _UNSET,
+                               google_url: Optional[str] = _UNSET,
                                ) -> Tuple[bool, profile.Profile]:
         """
         Update your profile details.
-            - The default of the parameters is ``False``. if you leave it ``False``, the parameter will not be updated.
+            - Only the parameters you pass are updated. Pass ``None`` to clear a field.
 
         :param first_name: First name.
         :type first_name: ``str``
@@ -148,50 +343,27 @@ class Account:
         :return: Tuple of: Is update success, new :py:obj:`~meapi.models.profile.Profile` object.
         :rtype: Tuple[``bool``, :py:obj:`~meapi.models.profile.Profile`]
         """
-        args = locals()
-        del args['self']
-        for key, value in args.items():
-            if value is not False:
-                if key == 'device_type':
-                    device_types = ['android', 'ios', None]
-                    if value not in device_types:
-                        raise MeException(f"Device type not in the available device types ({', '.join(device_types)})!")
-                if key == 'date_of_birth' and value is not None and not match(r'^\d{4}(\-)(((0)\d)|((1)[0-2]))(\-)([0-2]\d|(3)[0-1])$', flags=M, string=str(value)):
-                    raise MeException("Birthday must be in YYYY-MM-DD format!")
-                elif key in ['facebook_url', 'google_url'] and value is not None and not match(r'^\d+$', str(value)):
-                    raise MeException(f"{key} must be numbers!")
-                elif key == 'profile_picture':
-                    if value is not None:
-                        if not isinstance(value, str):
-                            raise MeException("profile_picture_url must be a url or path to a file!")
-                        args[key] = str(_upload_picture(self, **{'image': value}))
-                elif key == 'gender':
-                    if value not in ['M', 'm', 'F', 'f', None]:
-                        raise MeException("Gender must be: 'F' for Female, 'M' for Male, and 'None' for null.")
-                    if value:
-                        args[key] = str(value).upper()
-                elif key in ['first_name', 'last_name', 'slogan', 'location_name'] and type(value) not in [str, None]:
-                    raise MeException(f"{key} value must be a string or None!")
-                elif key == 'email':
-                    if value is not None and not match(r'^(([^<>()[\]\.,;:\s@\"]+(\.[^<>()[\]\.,;:\s@\"]+)*)|(\".+\"))@(([^<>()[\]\.,;:\s@\"]+\.)+[^<>()[\]\.,;:\s@\"]{2,})$', str(value)):
-                        raise MeException("Email must be in user@domain.com format!")
-                elif key == 'login_type':
-                    login_types = ['email', 'apple', None]
-                    if value not in login_types:
-                        raise MeException(f"{key} not in the available login types ({', '.join(login_types)})!")
-
-        body = {key: val for key, val in args.items() if val is not False}
+        values = (first_name, last_name, email, gender, slogan, profile_picture, date_of_birth,
+                  location_name, carrier, device_type, login_type, facebook_url, google_url)
+        body = {}
+        for key, value in zip(_PROFILE_FIELDS, values):
+            if value is _UNSET:
+                continue
+            validator = _PROFILE_VALIDATORS.get(key)
+            if validator is not None:
+                value = validator(self, key, value)
+            body[key] = value
+
         try:
             res = update_profile_details_raw(self, **body)
         except MeApiException as err:
             if err.http_status == 401 and err.msg == 'User is blocked for patch':
                 err.reason = "Locks like your account is blocked!"
             raise err
-        successes = 0
-        for key in body.keys():
-            if res[key] == body[key]:
-                successes += 1
-        return bool(successes == len(body.keys())), profile.Profile.new_from_dict(res, _client=self, _my_profile=True)
+        self._profile_cache.pop(self.uuid)
+        # profile_picture is skipped because Me converts it to their own url.
+        success = all(res.get(key) == value for key, value in body.items() if key != 'profile_picture')
+        return success, profile.Profile.new_from_dict(res, _client=self, _my_profile=True)
 
     def delete_account(self: 'Me', yes_im_sure: bool = False) -> bool:
         """
@@ -207,6 +379,7 @@ class Account:
             if input().lower() != 'y':
                 return False
         if delete_account_raw(self) == {}:
+            self._profile_cache.pop(self.uuid)
             self._logout()
             return True
         return False
@@ -225,16 +398,17 @@ class Account:
             if input().lower() != 'y':
                 return False
         if suspend_account_raw(self)['contact_suspended']:
+            self._profile_cache.pop(self.uuid)
             self._logout()
             return True
         return False
 
-    def add_contacts(self: 'Me', contacts: List[dict]) -> dict:
+    def add_contacts(self: 'Me', contacts: Iterable[dict]) -> dict:
         """
         Upload new contacts to your Me account. See :py:func:`upload_random_data`.
 
-        :param contacts: List of dicts with contacts data.
-        :type contacts: List[``dict``])
+        :param contacts: List (or any iterable, like a generator) of dicts with contacts data.
+        :type contacts: Iterable[``dict``]
         :return: Dict with upload results.
         :rtype: ``dict``
 
@@ -251,17 +425,50 @@ class Account:
         """
         return add_contacts_raw(self, validate_contacts(contacts))
 
-    def remove_contacts(self: 'Me', contacts: List[dict]) -> dict:
+    def remove_contacts(self: 'Me', contacts: Iterable[dict]) -> dict:
         """
         Remove contacts from your Me account.
 
-        :param contacts: List of dicts with contacts data.
-        :type contacts: List[``dict``]
+        :param contacts: List (or any iterable, like a generator) of dicts with contacts data.
+        :type contacts: Iterable[``dict``]
         :return: Dict with upload results.
         :rtype: ``dict``
         """
         return remove_contacts_raw(self, validate_contacts(contacts))
 
+    def sync_contacts(self: 'Me', add: Iterable[dict] = (), remove: Iterable[dict] = ()) -> dict:
+        """
+        Add and remove contacts from your Me account in one request.
+            - Use it instead of calling :py:func:`add_contacts` and :py:func:`remove_contacts` one after another.
+
+        :param add: List (or any iterable, like a generator) of dicts with contacts to add. *Default:* ``()``.
+        :type add: Iterable[``dict``]
+        :param remove: List (or any iterable, like a generator) of dicts with contacts to remove. *Default:* ``()``.
+        :type remove: Iterable[``dict``]
+        :raises MeException: If there are no valid contacts to add or remove.
+        :return: Dict with upload results.
+        :rtype: ``dict``
+        """
+        add, remove = list(iter_valid_contacts(add)), list(iter_valid_contacts(remove))
+        if not add and not remove:
+            raise MeException("Valid contacts not found! check this example for valid contact syntax: "
+                              "https://gist.github.com/david-lev/b158f1cc0cc783dbb13ff4b54416ceec#file-contacts-py")
+        return sync_contacts_raw(self, add=add, remove=remove)
+
+    def get_saved_and_unsaved_contacts(self: 'Me') -> Tuple[List[user.User], List[user.User]]:
+        """
+        Get the contacts stored in your contacts and the contacts that not stored in your contacts (Which has an Me account).
+            - Use it instead of calling :py:func:`get_saved_contacts` and :py:func:`get_unsaved_contacts` one after another, it fetches the groups only once.
+
+        :return: Tuple of: List of saved contacts, List of unsaved contacts.
+        :rtype: Tuple[List[:py:obj:`~meapi.models.user.User`], List[:py:obj:`~meapi.models.user.User`]]
+        """
+        saved, unsaved = [], []
+        for grp in self.get_groups():
+            for usr in grp.contacts:
+                (saved if usr.in_contact_list else unsaved).append(usr)
+        return saved, unsaved
+
     def get_saved_contacts(self: 'Me') -> List[user.User]:
         """
         Get all the contacts stored in your contacts (Which has an Me account).
@@ -269,7 +476,7 @@ class Account:
         :return: List of saved contacts.
         :rtype: List[:py:obj:`~meapi.models.user.User`]
         """
-        return [usr for grp in self.get_groups() for usr in grp.contacts if usr.in_contact_list]
+        return self.get_saved_and_unsaved_contacts()[0]
 
     def get_unsaved_contacts(self: 'Me') -> List[user.User]:
         """
@@ -278,14 +485,43 @@ class Account:
         :return: List of unsaved contacts.
         :rtype: List[:py:obj:`~meapi.models.user.User`]
         """
-        return [usr for grp in self.get_groups() for usr in grp.contacts if not usr.in_contact_list]
-
-    def add_calls_to_log(self: 'Me', calls: List[dict]) -> List[call.Call]:
+        return self.get_saved_and_unsaved_contacts()[1]
+
+    def get_vcards(self: 'Me',
+                   objects: Iterable[Union[profile.Profile, user.User, contact.Contact]],
+                   prefix_name: str = "",
+                   dl_profile_picture: bool = True,
+                   max_workers: int = 8,
+                   **kwargs) -> List[str]:
+        """
+        Get many profiles, users or contacts as vcards, the same as :py:func:`~meapi.models.common._CommonMethodsForUserContactProfile.as_vcard` on each one.
+            - The profile pictures are downloaded concurrently, before the vcards are built.
+
+        :param objects: :py:obj:`~meapi.models.profile.Profile`, :py:obj:`~meapi.models.user.User` or :py:obj:`~meapi.models.contact.Contact` objects.
+        :type objects: Iterable[:py:obj:`~meapi.models.profile.Profile` | :py:obj:`~meapi.models.user.User` | :py:obj:`~meapi.models.contact.Contact`]
+        :param prefix_name: Prefix to add to the name of every contact. *Default:* empty string ``""``.
+        :type prefix_name: ``str``
+        :param dl_profile_picture: Download and add the profile pictures to the vcards (if available). *Default:* ``True``.
+        :type dl_profile_picture: ``bool``
+        :param max_workers: Maximum number of pictures to download at the same time. *Default:* ``8``.
+        :type max_workers: ``int``
+        :param kwargs: Data to add to the ``notes`` field of every vcard, see :py:func:`~meapi.models.common._CommonMethodsForUserContactProfile.as_vcard`.
+        :return: List of vcards, in the order of ``objects``.
+        :rtype: List[``str``]
+        """
+        objects = list(objects)
+        pictures = {}
+        if dl_profile_picture:
+            pictures = get_img_binary_contents(filter(None, (getattr(obj, 'profile_picture', None) for obj in objects)),
+                                               max_workers=max_workers)
+        return [_build_vcard(obj, prefix_name, pictures.get(getattr(obj, 'profile_picture', None)), kwargs) for obj in objects]
+
+    def add_calls_to_log(self: 'Me', calls: Iterable[dict]) -> List[call.Call]:
         """
         Add call to your calls log. See :py:func:`upload_random_data`.
 
-        :param calls: List of dicts with calls data.
-        :type calls: List[``dict``]
+        :param calls: List (or any iterable, like a generator) of dicts with calls data.
+        :type calls: Iterable[``dict``]
         :return: dict with upload result.
         :rtype: ``dict``
 
@@ -304,14 +540,14 @@ class Account:
         """
         body = {"add": validate_calls(calls), "remove": []}
         r = self._make_request('post', '/main/call-log/change-sync/', body)
-        return [call.Call.new_from_dict(cal) for cal in r['added_list']]
+        return call.Call.new_from_dicts(r['added_list'])
 
-    def remove_calls_from_log(self: 'Me', calls: List[dict]) -> List[call.Call]:
+    def remove_calls_from_log(self: 'Me', calls: Iterable[dict]) -> List[call.Call]:
         """
         Remove calls from your calls log.
 
-        :param calls: List of dicts with calls data.
-        :type calls: List[``dict``]
+        :param calls: List (or any iterable, like a generator) of dicts with calls data.
+        :type calls: Iterable[``dict``]
         :return: dict with upload result.
         :rtype: ``dict``
 
@@ -329,7 +565,7 @@ class Account:
             ]
         """
         body = {"add": [], "remove": validate_calls(calls)}
-        return [call.Call.new_from_dict(cal) for cal in self._make_request('post', '/main/call-log/change-sync/', body)]
+        return call.Call.new_from_dicts(self._make_request('post', '/main/call-log/change-sync/', body))
 
     def block_profile(self: 'Me', phone_number: Union[str, int], block_contact=True, me_full_block=True) -> blocked_number.BlockedNumber:
         """
@@ -344,9 +580,10 @@ class Account:
         :return: :py:obj:`~meapi.models.blocked_number.BlockedNumber` object.
         :rtype: :py:obj:`~meapi.models.blocked_number.BlockedNumber`
         """
-        res = block_profile_raw(client=self, phone_number=validate_phone_number(phone_number), me_full_block=me_full_block, block_contact=block_contact)
-        if res['success']:
-            return blocked_number.BlockedNumber.new_from_dict(**res, _client=self)
+        phone_number = validate_phone_number(phone_number)
+        if self._change_block_status(phone_number, block_contact=block_contact, me_full_block=me_full_block):
+            return blocked_number.BlockedNumber.new_from_dict({'phone_number': phone_number, 'block_contact': block_contact,
+                                                               'me_full_block': me_full_block}, _client=self)
 
     def unblock_profile(self: 'Me', phone_number: int, unblock_contact=True, me_full_unblock=True) -> bool:
         """
@@ -361,45 +598,126 @@ class Account:
         :return: Is successfully unblocked.
         :rtype: ``bool``
         """
-        res = unblock_profile_raw(client=self, phone_number=validate_phone_number(phone_number), me_full_unblock=me_full_unblock, unblock_contact=unblock_contact)
-        if res['success']:
-            return True
-        return False
+        return self._change_block_status(validate_phone_number(phone_number), block_contact=not unblock_contact, me_full_block=not me_full_unblock)
+
+    def block_profiles(self: 'Me', phone_numbers: List[Union[str, int]], block_contact=True, me_full_block=True, max_workers: int = 8) -> Dict[int, bool]:
+        """
+        Block many user profiles at once, with the same options as :py:func:`block_profile`.
+            - The requests are sent concurrently. To block only for calls (``me_full_block=False``), the bulk endpoint of :py:func:`block_numbers` is used instead.
+
+        :param phone_numbers: List of phone numbers in international format.
+        :type phone_numbers: List[``str`` | ``int``]
+        :param block_contact: To block for calls. *Default:* ``True``.
+        :type block_contact: ``bool``
+        :param me_full_block: To block for social. *Default:* ``True``.
+        :type me_full_block: ``bool``
+        :param max_workers: Maximum number of requests to send at the same time. *Default:* ``8``.
+        :type max_workers: ``int``
+        :raises MeException: If one of the phone numbers is not valid.
+        :return: Dict of each clean phone number and whether it was blocked.
+        :rtype: Dict[``int``, ``bool``]
+        """
+        return self._change_block_status_many(phone_numbers, block_contact, me_full_block, max_workers, bulk_block=True)
+
+    def unblock_profiles(self: 'Me', phone_numbers: List[Union[str, int]], unblock_contact=True, me_full_unblock=True, max_workers: int = 8) -> Dict[int, bool]:
+        """
+        Unblock many user profiles at once, with the same options as :py:func:`unblock_profile`.
+            - The requests are sent concurrently. To unblock only for calls, :py:func:`unblock_numbers` uses one bulk request.
 
-    def block_numbers(self: 'Me', numbers: Union[int, List[int]]) -> bool:
+        :param phone_numbers: List of phone numbers in international format.
+        :type phone_numbers: List[``str`` | ``int``]
+        :param unblock_contact: To unblock for calls. *Default:* ``True``.
+        :type unblock_contact: ``bool``
+        :param me_full_unblock: To unblock for social. *Default:* ``True``.
+        :type me_full_unblock: ``bool``
+        :param max_workers: Maximum number of requests to send at the same time. *Default:* ``8``.
+        :type max_workers: ``int``
+        :raises MeException: If one of the phone numbers is not valid.
+        :return: Dict of each clean phone number and whether it was unblocked.
+        :rtype: Dict[``int``, ``bool``]
+        """
+        return self._change_block_status_many(phone_numbers, not unblock_contact, not me_full_unblock, max_workers, bulk_block=False)
+
+    def _change_block_status_many(self: 'Me', phone_numbers: List[Union[str, int]], block_contact: bool, me_full_block: bool,
+                                  max_workers: int, bulk_block: bool) -> Dict[int, bool]:
+        """
+        Internal method to block or unblock many phone numbers concurrently. Used by :py:func:`block_profiles` and :py:func:`unblock_profiles`.
+            - ``bulk_block`` is only set by :py:func:`block_profiles`: the bulk-block endpoint of :py:func:`block_numbers`
+              blocks for calls only (it returns ``block_contact=True, me_full_block=False`` for every number), nothing
+              shows it can lift a block, so unblocking always goes through the per-number block endpoint.
+        """
+        numbers = _validate_numbers(phone_numbers)  # all numbers are validated before the first request
+        if bulk_block and block_contact and not me_full_block:  # calls only, same as the bulk endpoint: one request per chunk.
+            self._blocked_numbers_cache.clear()
+            self._profile_cache.clear()
+            with ThreadPoolExecutor(max_workers=_BULK_MAX_WORKERS) as executor:
+                results = executor.map(lambda chunk: block_numbers_raw(self, chunk), _chunks(numbers))
+                blocked = {phone['phone_number'] for result in results for phone in result}
+            for number in numbers:
+                self._search_cache.pop(number)
+            return {number: number in blocked for number in numbers}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(lambda number: self._change_block_status(number, block_contact, me_full_block), numbers)
+            return dict(zip(numbers, results))
+
+    def _change_block_status(self: 'Me', phone_number: int, block_contact: bool, me_full_block: bool) -> bool:
+        """
+        Internal method to block or unblock a validated phone number. Used by :py:func:`block_profile` and :py:func:`unblock_profile`.
+        """
+        res = block_profile_raw(client=self, phone_number=phone_number, block_contact=block_contact, me_full_block=me_full_block)
+        self._search_cache.pop(phone_number)
+        self._blocked_numbers_cache.clear()
+        self._profile_cache.clear()  # cached by uuid, which is unknown here: clear all, blocks are rare
+        return bool(res['success'])
+
+    def block_numbers(self: 'Me', numbers: Union[int, str, List[Union[int, str]]]) -> bool:
         """
         Block phone numbers.
 
         :param numbers: Single or list of phone numbers in international format.
-        :type numbers: ``int`` | List[``int``]
+        :type numbers: ``int`` | ``str`` | List[``int`` | ``str``]
+        :raises MeException: If no phone numbers are given or one of them is not valid.
         :return: Is blocked success.
         :rtype: ``bool``
         """
-        if not isinstance(numbers, list) and isinstance(numbers, int):
-            numbers = [numbers]
-        return bool([phone['phone_number'] for phone in block_numbers_raw(self, numbers)].sort() == numbers.sort())
+        numbers = _validate_numbers(numbers)
+        self._blocked_numbers_cache.clear()
+        self._profile_cache.clear()
+        with ThreadPoolExecutor(max_workers=_BULK_MAX_WORKERS) as executor:
+            results = executor.map(lambda chunk: block_numbers_raw(self, chunk), _chunks(numbers))
+            blocked = {phone['phone_number'] for result in results for phone in result}
+        return blocked == set(numbers)
 
-    def unblock_numbers(self: 'Me', numbers: Union[int, List[int]]) -> bool:
+    def unblock_numbers(self: 'Me', numbers: Union[int, str, List[Union[int, str]]]) -> bool:
         """
         Unblock numbers.
 
         :param numbers: Single or list of phone numbers in international format. See :py:func:`get_blocked_numbers`.
-        :type numbers: ``int`` | List[``int``]
+        :type numbers: ``int`` | ``str`` | List[``int`` | ``str``]
+        :raises MeException: If no phone numbers are given or one of them is not valid.
         :return: Is unblocking success.
         :rtype: ``bool``
         """
-        if not isinstance(numbers, list):
-            numbers = [numbers]
-        return unblock_numbers_raw(self, numbers)['success']
+        numbers = _validate_numbers(numbers)
+        self._blocked_numbers_cache.clear()
+        self._profile_cache.clear()
+        with ThreadPoolExecutor(max_workers=_BULK_MAX_WORKERS) as executor:
+            results = executor.map(lambda chunk: unblock_numbers_raw(self, chunk), _chunks(numbers))
+            return all([result['success'] for result in results])
 
     def get_blocked_numbers(self: 'Me') -> List[blocked_number.BlockedNumber]:
         """
         Get list of your blocked numbers. See :py:func:`unblock_numbers`.
+            - The list is cached for 30 seconds, and refreshed after every block or unblock.
 
         :return: List of :py:class:`blocked_number.BlockedNumber` objects.
         :rtype: List[:py:obj:`~meapi.models.blocked_number.BlockedNumber`]
         """
-        return [blocked_number.BlockedNumber.new_from_dict(blocked) for blocked in get_blocked_numbers_raw(self)]
+        blocked_numbers = self._blocked_numbers_cache.get('blocked_numbers')
+        if blocked_numbers is None:
+            blocked_numbers = get_blocked_numbers_raw(self)
+            self._blocked_numbers_cache.set('blocked_numbers', blocked_numbers)
+        return blocked_number.BlockedNumber.new_from_dicts(blocked_numbers, _client=self)
 
     def upload_random_data(self: 'Me', contacts=True, calls=True, location=True) -> bool:
         """
@@ -415,10 +733,14 @@ class Account:
         :rtype: ``bool``
         """
         random_data = generate_random_data(contacts, calls, location)
-        if contacts:
-            self.add_contacts(random_data['contacts'])
-        if calls:
-            self.add_calls_to_log(random_data['calls'])
-        if location:
-            self.update_location(random_data['location']['lat'], random_data['location']['lon'])
+        with ThreadPoolExecutor(max_workers=3) as executor:  # the uploads are independent, send them together.
+            uploads = []
+            if contacts:
+                uploads.append(executor.submit(self.add_contacts, random_data['contacts']))
+            if calls:
+                uploads.append(executor.submit(self.add_calls_to_log, random_data['calls']))
+            if location:
+                uploads.append(executor.submit(self.update_location, random_data['location']['lat'], random_data['location']['lon']))
+            for upload in uploads:
+                upload.result()  # re-raise errors from the upload, if any.
         return True
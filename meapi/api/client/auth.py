@@ -1,11 +1,11 @@
-from json import JSONDecodeError, loads
+from json import JSONDecodeError
 from os import environ
-from re import match
+from re import compile
 from time import sleep
 from typing import Union, TYPE_CHECKING
 from meapi.api.raw.auth import generate_new_access_token_raw, activate_account_raw, ask_for_sms_raw, ask_for_call_raw
 from meapi.utils.exceptions import MeException, MeApiException
-from meapi.utils.helpers import _get_session, HEADERS
+from meapi.utils.helpers import _get_session, json_dumps, json_loads, HEADERS
 from meapi.utils.validations import validate_auth_response
 
 if TYPE_CHECKING:  # always False at runtime.
@@ -14,6 +14,8 @@ if TYPE_CHECKING:  # always False at runtime.
 ME_BASE_API = 'https://app.mobile.me.app'
 wa_auth_url = "https://wa.me/972543229534?text=Connectme"
 tg_auth_url = "http://t.me/Meofficialbot?start=__iw__{}"
+_ACTIVATION_CODE_RE = compile(r'\d{6}')
+_REQUEST_TYPES = ('post', 'get', 'put', 'patch', 'delete')
 
 
 class Auth:
@@ -43,7 +45,7 @@ class Auth:
             activation_code = self._activation_code
             self._activation_code = None  # expire after one use
 
-        if activation_code and not match(r'^\d{6}$', str(activation_code)):
+        if activation_code and not _ACTIVATION_CODE_RE.fullmatch(str(activation_code)):
             raise MeException("Not a valid 6-digits activation code!")
         if not activation_code:
             methods = {1: 'wa_tg', 2: 'sms', 3: 'call'}
@@ -84,7 +86,7 @@ class Auth:
 
         while not activation_code:
             activation_code = input("** Enter your verification code (6 digits): ")
-            while not match(r'^\d{6}$', str(activation_code)):
+            while not _ACTIVATION_CODE_RE.fullmatch(str(activation_code)):
                 activation_code = input("** Incorrect code. The verification code includes 6 digits. Please enter: ")
         try:
             results = activate_account_raw(self, self.phone_number, activation_code)
@@ -184,26 +186,34 @@ class Auth:
         :return: API response as dict or list.
         :rtype:  ``dict`` | ``list``
         """
-        url = ME_BASE_API + endpoint
-        request_types = ['post', 'get', 'put', 'patch', 'delete']
-        if req_type not in request_types:
-            raise MeException("Request type not in requests type list!!\nAvailable types: " + ", ".join(request_types))
+        url = f'{ME_BASE_API}{endpoint}'
+        if req_type not in _REQUEST_TYPES:
+            raise MeException("Request type not in requests type list!!\nAvailable types: " + ", ".join(_REQUEST_TYPES))
         if headers is None:
             headers = HEADERS
+        data = None
+        if body is not None:
+            data = json_dumps(body)  # encoded once, not again on a retry after a token refresh
+            if 'content-type' not in headers:
+                headers = {**headers, 'content-type': HEADERS['content-type']}
         max_rounds = 3
         while max_rounds != 0:
             max_rounds -= 1
-            headers['authorization'] = self._access_token
-            response = getattr(self._session, req_type)(url=url, json=body, files=files, headers=headers, proxies=self._proxies)
+            # a copy per request: the shared HEADERS (and the caller headers) must not carry this client's token.
+            request_headers = {**headers, 'authorization': self._access_token}
+            response = self._session.request(req_type, url=url, data=data, files=files, headers=request_headers, proxies=self._proxies)
             try:
-                response_text = loads(response.text)
+                response_text = json_loads(response.content)
             except JSONDecodeError:
                 raise MeException(f"The response (Status code: {response.status_code}) received does not contain a valid JSON:\n" + str(response.text))
             if response.status_code == 403 and self.phone_number:
-                if self._generate_access_token():
-                    self._access_token = validate_auth_response(self._credentials_manager.get(str(self.phone_number))).get('access')
-                    continue
-                raise MeException("Cannot generate new access token!")
+                with self._token_lock:  # reentrant: the refresh itself sends requests
+                    # another thread may have refreshed the token while this request was sent, then just retry with it.
+                    if self._access_token == request_headers['authorization']:
+                        if not self._generate_access_token():
+                            raise MeException("Cannot generate new access token!")
+                        self._access_token = validate_auth_response(self._credentials_manager.get(str(self.phone_number))).get('access')
+                continue
 
             if response.status_code >= 400:
                 try:
@@ -1,10 +1,33 @@
-from typing import Tuple
+from contextlib import contextmanager
+from typing import Tuple, Iterator
 from meapi.utils.exceptions import MeException
 from meapi.models import settings
 from meapi.api.raw.settings import *
 if TYPE_CHECKING:  # always False at runtime.
     from meapi import Me
 
+_SETTINGS_FIELDS = ('mutual_contacts_available', 'who_watched_enabled', 'who_deleted_enabled', 'comments_enabled',
+                    'location_enabled', 'language', 'who_deleted_notification_enabled',
+                    'who_watched_notification_enabled', 'distance_notification_enabled', 'system_notification_enabled',
+                    'birthday_notification_enabled', 'comments_notification_enabled', 'names_notification_enabled',
+                    'notifications_enabled')
+_SETTINGS_NAMES = frozenset(_SETTINGS_FIELDS)
+
+
+class _SettingsBatch:
+    """
+    Internal class to collect settings changes inside :py:func:`Settings.settings_batch`.
+        - ``result`` is the return value of :py:func:`Settings.change_settings` after the block, ``None`` if nothing was sent.
+    """
+    def __init__(self):
+        object.__setattr__(self, 'changes', {})
+        object.__setattr__(self, 'result', None)
+
+    def __setattr__(self, key, value):
+        if key not in _SETTINGS_NAMES:
+            raise MeException(f"'{key}' is not a setting! The settings are: {list(_SETTINGS_FIELDS)}")
+        self.changes[key] = value
+
 
 class Settings:
     """
@@ -17,11 +40,16 @@ class Settings:
     def get_settings(self: 'Me') -> settings.Settings:
         """
         Get current settings.
+            - The settings are cached for 30 seconds, and updated after every change.
 
         :return: :py:class:`~meapi.models.settings.Settings` object.
         :rtype: :py:class:`~meapi.models.settings.Settings`
         """
-        return settings.Settings.new_from_dict(get_settings_raw(self), _client=self)
+        results = self._settings_cache.get('settings')
+        if results is None:
+            results = get_settings_raw(self)
+            self._settings_cache.set('settings', results)
+        return settings.Settings.new_from_dict(results, _client=self)
 
     def change_settings(self: 'Me',
                         mutual_contacts_available: bool = None,
@@ -41,6 +69,7 @@ class Settings:
                         ) -> Tuple[bool, settings.Settings]:
         """
         Change social, app and notification settings.
+            - No request is sent if the cached settings (see :py:func:`get_settings`) already have the new values.
 
         :param mutual_contacts_available: Show common contacts between users. *Default:* ``None``.
         :type mutual_contacts_available: ``bool``
@@ -78,14 +107,39 @@ class Settings:
         :return: Tuple: Is success, :py:class:`~meapi.models.settings.Settings` object.
         :rtype: Tuple[``bool``, :py:class:`~meapi.models.settings.Settings`]
         """
-        args = locals()
-        del args['self']
-        body = {setting: value for setting, value in args.items() if value is not None}
+        values = (mutual_contacts_available, who_watched_enabled, who_deleted_enabled, comments_enabled,
+                  location_enabled, language, who_deleted_notification_enabled, who_watched_notification_enabled,
+                  distance_notification_enabled, system_notification_enabled, birthday_notification_enabled,
+                  comments_notification_enabled, names_notification_enabled, notifications_enabled)
+        body = {setting: value for setting, value in zip(_SETTINGS_FIELDS, values) if value is not None}
         if not body:
             raise MeException("You need to change at least one setting!")
+        cached = self._settings_cache.get('settings')
+        if cached is not None and all(cached.get(key) == value for key, value in body.items()):
+            return True, settings.Settings.new_from_dict(cached, _client=self)  # nothing to change
         results = change_settings_raw(self, **body)
-        success = True
-        for key, value in body.items():
-            if results[key] != value:
-                success = False
+        if cached is not None:  # the response has the current value of every setting, no need to get them again
+            self._settings_cache.set('settings', {**cached, **results})
+        self._profile_cache.pop(self.uuid)  # some settings are part of the profile
+        success = all(results.get(key) == value for key, value in body.items())
         return success, settings.Settings.new_from_dict(results, _client=self)
+
+    @contextmanager
+    def settings_batch(self: 'Me') -> Iterator[_SettingsBatch]:
+        """
+        Collect settings changes and send them in one :py:func:`change_settings` request when the ``with`` block ends.
+            - Assign the settings to the yielded object, the names are the same as in :py:func:`change_settings`.
+            - Nothing is sent if the block raises an exception.
+            - After the block, ``batch.result`` holds the ``(success, Settings)`` tuple returned by :py:func:`change_settings` (``None`` if no setting was assigned). No exception is raised when ``success`` is ``False``, check it like the return value of :py:func:`change_settings`.
+
+        Example::
+
+            >>> with me.settings_batch() as batch:
+            ...     batch.who_watched_enabled = True
+            ...     batch.language = 'en'
+            >>> success, new_settings = batch.result
+        """
+        batch = _SettingsBatch()
+        yield batch
+        if batch.changes:
+            object.__setattr__(batch, 'result', self.change_settings(**batch.changes))
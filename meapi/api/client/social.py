@@ -1,10 +1,11 @@
-from re import match, sub
-from typing import Union, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from re import compile
+from typing import Union, Optional, Iterator, Iterable, Callable, Tuple
 from meapi.models.contact import Contact
 from meapi.models.profile import Profile
 from meapi.models.user import User
 from meapi.utils.exceptions import MeException, MeApiException
-from datetime import date
 from meapi.utils.validations import validate_phone_number
 from meapi.models import deleter, watcher, group, social, user, comment, friendship
 from meapi.api.raw.social import *
@@ -14,6 +15,11 @@ if TYPE_CHECKING:  # always False at runtime.
     from meapi import Me
 
 _logger = getLogger(__name__)
+_SOCIAL_SUFFIX_RE = compile(r'_(token|url)$')
+_SOCIAL_NAMES = ('twitter', 'spotify', 'instagram', 'facebook', 'tiktok', 'pinterest', 'linkedin')
+_ADD_SOCIAL_FIELDS = ('twitter_token', 'spotify_token', 'instagram_token', 'facebook_token', 'tiktok_token',
+                      'pinterest_url', 'linkedin_url')
+_SOCIAL_URL_RES = {name: compile(r"^https?:\/\/.*{domain}.*$".format(domain=name)) for name in ('pinterest', 'linkedin')}
 
 
 class Social:
@@ -74,7 +80,7 @@ class Social:
         res = who_deleted_raw(self)
         if incognito:
             self.change_settings(who_deleted_enabled=False)
-        deleters = [deleter.Deleter.new_from_dict(dlt) for dlt in res]
+        deleters = deleter.Deleter.new_from_dicts(res)
         return sorted(deleters, key=attrgetter(sorted_by), reverse=True) if sorted_by else deleters
 
     def who_watched(self: 'Me', incognito: bool = False, sorted_by: str = 'count') -> List[watcher.Watcher]:
@@ -98,8 +104,7 @@ class Social:
         res = who_watched_raw(self)
         if incognito:
             self.change_settings(who_watched_enabled=False)
-        return sorted([watcher.Watcher.new_from_dict(watch) for watch in
-                       res], key=attrgetter(sorted_by), reverse=True)
+        return sorted(watcher.Watcher.new_from_dicts(res), key=attrgetter(sorted_by), reverse=True)
 
     def get_comments(self: 'Me', uuid: Union[str, Profile, User, Contact] = None) -> List[comment.Comment]:
         """
@@ -121,6 +126,29 @@ class Social:
         :return: List of :py:obj:`~meapi.models.comment.Comment` objects sorted by their like count.
         :rtype: List[:py:obj:`~meapi.models.comment.Comment`]
         """
+        uuid, _my_comment = self._get_comments_owner(uuid)
+        comments = get_comments_raw(self, uuid)['comments']
+        return sorted(comment.Comment.new_from_dicts(comments, _client=self, _my_comment=_my_comment, profile_uuid=uuid),
+                      key=attrgetter('like_count'), reverse=True)
+
+    def iter_comments(self: 'Me', uuid: Union[str, Profile, User, Contact] = None) -> Iterator[comment.Comment]:
+        """
+        Iterate over the comments in user's profile, like :py:func:`get_comments` but without sorting.
+            - Every :py:obj:`~meapi.models.comment.Comment` object is created only when the iteration reaches it, useful to stop early on profiles with many comments.
+
+        :param uuid: ``uuid`` of the user or :py:obj:`~meapi.models.profile.Profile`, :py:obj:`~meapi.models.user.User`, or :py:obj:`~meapi.models.contact.Contact` objects. *Default:* Your uuid.
+        :type uuid: ``str`` | :py:obj:`~meapi.models.user.User` | :py:obj:`~meapi.models.profile.Profile` | :py:obj:`~meapi.models.contact.Contact`
+        :return: Iterator of :py:obj:`~meapi.models.comment.Comment` objects, in the order of the api.
+        :rtype: Iterator[:py:obj:`~meapi.models.comment.Comment`]
+        """
+        uuid, _my_comment = self._get_comments_owner(uuid)
+        for com in get_comments_raw(self, uuid)['comments']:
+            yield comment.Comment.new_from_dict(com, _client=self, _my_comment=_my_comment, profile_uuid=uuid)
+
+    def _get_comments_owner(self: 'Me', uuid: Union[str, Profile, User, Contact, None]) -> Tuple[str, bool]:
+        """
+        Internal method to get the uuid of the profile and whether it is yours. Used by :py:func:`get_comments` and :py:func:`iter_comments`.
+        """
         if isinstance(uuid, (User, Profile)):
             uuid = uuid.uuid
         if isinstance(uuid, Contact):
@@ -136,9 +164,7 @@ class Social:
                 raise MeException("In the official-auth-method mode you must to provide user uuid.")
         else:
             _my_comment = False
-        comments = get_comments_raw(self, str(uuid))['comments']
-        return sorted([comment.Comment.new_from_dict(com, _client=self, _my_comment=_my_comment, profile_uuid=uuid)
-                       for com in comments], key=lambda x: x.like_count, reverse=True)
+        return str(uuid), _my_comment
 
     def get_comment(self: 'Me', comment_id: Union[int, str]) -> comment.Comment:
         """
@@ -298,6 +324,59 @@ class Social:
                 return False
             raise err
 
+    def approve_comments(self: 'Me', comment_ids: List[Union[int, str, comment.Comment]], max_workers: int = 8) -> List[bool]:
+        """
+        Approve many comments at once, with the same rules as :py:func:`approve_comment`.
+            - The requests are sent concurrently.
+            - Only comments in your profile can be approved.
+
+        :param comment_ids: List of comment ids from :py:func:`get_comments` or :py:obj:`~meapi.models.comment.Comment` objects.
+        :type comment_ids: List[``int`` | ``str`` | :py:obj:`~meapi.models.comment.Comment`]
+        :param max_workers: Maximum number of requests to send at the same time. *Default:* ``8``.
+        :type max_workers: ``int``
+        :return: Whether each comment was approved, in the order of ``comment_ids``.
+        :rtype: List[``bool``]
+        """
+        return self._for_each_comment(self.approve_comment, comment_ids, max_workers)
+
+    def delete_comments(self: 'Me', comment_ids: List[Union[int, str, comment.Comment]], max_workers: int = 8) -> List[bool]:
+        """
+        Delete (Ignore) many comments at once, with the same rules as :py:func:`delete_comment`.
+            - The requests are sent concurrently.
+            - Only comments in your profile can be deleted.
+
+        :param comment_ids: List of comment ids from :py:func:`get_comments` or :py:obj:`~meapi.models.comment.Comment` objects.
+        :type comment_ids: List[``int`` | ``str`` | :py:obj:`~meapi.models.comment.Comment`]
+        :param max_workers: Maximum number of requests to send at the same time. *Default:* ``8``.
+        :type max_workers: ``int``
+        :return: Whether each comment was deleted, in the order of ``comment_ids``.
+        :rtype: List[``bool``]
+        """
+        return self._for_each_comment(self.delete_comment, comment_ids, max_workers)
+
+    def like_comments(self: 'Me', comment_ids: List[Union[int, str, comment.Comment]], max_workers: int = 8) -> List[bool]:
+        """
+        Like many comments at once, with the same rules as :py:func:`like_comment`.
+            - The requests are sent concurrently.
+
+        :param comment_ids: List of comment ids from :py:func:`get_comments` or :py:obj:`~meapi.models.comment.Comment` objects.
+        :type comment_ids: List[``int`` | ``str`` | :py:obj:`~meapi.models.comment.Comment`]
+        :param max_workers: Maximum number of requests to send at the same time. *Default:* ``8``.
+        :type max_workers: ``int``
+        :return: Whether each comment was liked, in the order of ``comment_ids``.
+        :rtype: List[``bool``]
+        """
+        return self._for_each_comment(self.like_comment, comment_ids, max_workers)
+
+    @staticmethod
+    def _for_each_comment(method: Callable[[Union[int, str, comment.Comment]], bool],
+                          comment_ids: List[Union[int, str, comment.Comment]], max_workers: int) -> List[bool]:
+        """
+        Internal method to call a single-comment method on many comments concurrently.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(method, comment_ids))
+
     def get_groups(self: 'Me', sorted_by: str = 'count') -> List[group.Group]:
         """
         Get groups of names and see how people named you.
@@ -310,10 +389,30 @@ class Social:
         """
         if sorted_by not in ['count', 'last_contact_at']:
             raise MeException("sorted_by must be one of 'count' or 'last_contact_at'.")
-        return sorted([group.Group.new_from_dict(grp, _client=self, is_active=True) for grp in
-                       get_groups_raw(self)['groups']],
+        res = self._groups_cache if self._groups_cache is not None else get_groups_raw(self)
+        return sorted(group.Group.new_from_dicts(res['groups'], _client=self, is_active=True),
                       key=attrgetter(sorted_by), reverse=True)
 
+    @contextmanager
+    def cached_groups(self: 'Me') -> Iterator[None]:
+        """
+        Fetch the groups once and reuse them in every :py:func:`get_groups` call inside the ``with`` block.
+            - Useful when calling few methods that rely on the groups, like :py:func:`get_saved_contacts` and :py:func:`get_unsaved_contacts`.
+            - Changes you make to the groups inside the block (:py:func:`delete_group` etc.) are not reflected until the block ends.
+
+        Example::
+
+            >>> with me.cached_groups():
+            ...     saved = me.get_saved_contacts()
+            ...     unsaved = me.get_unsaved_contacts()
+        """
+        previous = self._groups_cache
+        self._groups_cache = get_groups_raw(self)
+        try:
+            yield
+        finally:
+            self._groups_cache = previous
+
     def get_deleted_groups(self: 'Me') -> List[group.Group]:
         """
         Get group names that you deleted.
@@ -333,7 +432,7 @@ class Social:
             groups[name['name']]['name'] = name['name']
 
         return sorted([group.Group.new_from_dict(grp, _client=self, is_active=False, count=len(grp['contact_ids']))
-                       for grp in groups.values()], key=lambda x: x.count, reverse=True)
+                       for grp in groups.values()], key=attrgetter('count'), reverse=True)
 
     def delete_group(self: 'Me', contacts_ids: Union[group.Group, int, str, List[Union[int, str]]]) -> bool:
         """
@@ -349,8 +448,8 @@ class Social:
         if isinstance(contacts_ids, group.Group):
             contacts_ids = contacts_ids.contact_ids
         if isinstance(contacts_ids, (int, str)):
-            contacts_ids = [contacts_ids]
-        return delete_group_raw(self, [int(_id) for _id in contacts_ids])['success']
+            contacts_ids = (contacts_ids,)
+        return delete_group_raw(self, list(map(int, contacts_ids)))['success']
 
     def restore_group(self: 'Me', contacts_ids: Union[int, str, List[Union[int, str]]]) -> bool:
         """
@@ -365,8 +464,8 @@ class Social:
         if isinstance(contacts_ids, group.Group):
             contacts_ids = contacts_ids.contact_ids
         if isinstance(contacts_ids, (int, str)):
-            contacts_ids = [contacts_ids]
-        return restore_group_raw(self, [int(_id) for _id in contacts_ids])['success']
+            contacts_ids = (contacts_ids,)
+        return restore_group_raw(self, list(map(int, contacts_ids)))['success']
 
     def ask_group_rename(self: 'Me', contacts_ids: Union[group.Group, int, str, List[Union[int, str]]], new_name: Optional[str] = None) -> bool:
         """
@@ -382,16 +481,17 @@ class Social:
         if not new_name:  # suggest your name in your profile
             new_name = self.get_my_profile().name
         if isinstance(contacts_ids, (int, str)):
-            contacts_ids = [contacts_ids]
+            contacts_ids = (contacts_ids,)
         if isinstance(contacts_ids, group.Group):
             if contacts_ids.name == new_name:
                 raise MeException("The name of the group is already the same as the suggested name.")
             contacts_ids = contacts_ids.contact_ids
-        return ask_group_rename_raw(self, [int(_id) for _id in contacts_ids], new_name)['success']
+        return ask_group_rename_raw(self, list(map(int, contacts_ids)), new_name)['success']
 
     def get_socials(self: 'Me', uuid: Union[str, Profile, User, Contact] = None) -> social.Social:
         """
         Get connected social networks to ``Me`` account.
+            - Your socials are cached for 30 seconds, and refreshed after every change (:py:func:`add_social` etc.).
 
         :param uuid: uuid of the user or :py:obj:`~meapi.models.profile.Profile`, :py:obj:`~meapi.models.user.User`, or :py:obj:`~meapi.models.contact.Contact` objects. *Default:* Your uuid.
         :type uuid: ``str`` | :py:obj:`~meapi.models.profile.Profile` | :py:obj:`~meapi.models.user.User` | :py:obj:`~meapi.models.contact.Contact`
@@ -406,7 +506,11 @@ class Social:
             else:
                 raise MeException("Contact has no user.")
         if not uuid:
-            return social.Social.new_from_dict(get_my_social_raw(self), _client=self, _my_social=True)
+            results = self._socials_cache.get('socials')
+            if results is None:
+                results = get_my_social_raw(self)
+                self._socials_cache.set('socials', results)
+            return social.Social.new_from_dict(results, _client=self, _my_social=True)
         return self.get_profile(uuid).social
 
     def add_social(self: 'Me',
@@ -438,26 +542,32 @@ class Social:
         :return: Is connected successfully.
         :rtype: ``bool``
         """
-        args = locals()
-        del args['self']
-        not_null_values = sum(bool(i) for i in args.values())
-        if not_null_values < 1:
+        args = dict(zip(_ADD_SOCIAL_FIELDS, (twitter_token, spotify_token, instagram_token, facebook_token, tiktok_token,
+                                             pinterest_url, linkedin_url)))
+        if not any(args.values()):
             raise MeException("You need to provide at least one social!")
-        successes = 0
+        to_add = []  # all the urls are validated before the first request
         for soc, token_or_url in args.items():
-            if token_or_url is not None:
+            if token_or_url:
+                social_name = _SOCIAL_SUFFIX_RE.sub('', soc)
                 if soc.endswith('url'):
-                    if match(r"^https?:\/\/.*{domain}.*$".format(domain=soc.replace('_url', '')), token_or_url):
+                    if _SOCIAL_URL_RES[social_name].match(token_or_url):
                         is_token = False
                     else:
-                        raise MeException(f"You must provide a valid link to the {soc.replace('_url', '').capitalize()} profile!")
+                        raise MeException(f"You must provide a valid link to the {social_name.capitalize()} profile!")
                 else:
                     is_token = True
-                social_name = sub(r'_(token|url)$', '', soc)
-                results = add_social_token_raw(self, social_name, token_or_url) if is_token else add_social_url_raw(self, social_name, token_or_url)
-                if results['success'] if is_token else bool(results[social_name]['profile_id'] == token_or_url):
-                    successes += 1
-        return bool(successes == not_null_values)
+                to_add.append((social_name, token_or_url, is_token))
+
+        def add(social_name: str, token_or_url: str, is_token: bool) -> bool:
+            if is_token:
+                return bool(add_social_token_raw(self, social_name, token_or_url)['success'])
+            return bool(add_social_url_raw(self, social_name, token_or_url)[social_name]['profile_id'] == token_or_url)
+
+        with ThreadPoolExecutor(max_workers=len(to_add) or 1) as executor:  # every social has its own request
+            successes = sum(executor.map(lambda item: add(*item), to_add))
+        self._clear_socials_cache()
+        return bool(successes == len(to_add))
 
     def remove_social(self: 'Me',
                       twitter: bool = False,
@@ -489,17 +599,14 @@ class Social:
         :return: Is removal success.
         :rtype: ``bool``
         """
-        args = locals()
-        del args['self']
-        true_values = sum(args.values())
-        if true_values < 1:
+        args = dict(zip(_SOCIAL_NAMES, (twitter, spotify, instagram, facebook, tiktok, pinterest, linkedin)))
+        to_remove = [soc for soc, value in args.items() if value is True]
+        if not to_remove:
             raise MeException("You need to remove at least one social!")
-        successes = 0
-        for soc, value in args.items():
-            if value is True:
-                if remove_social_raw(self, str(soc))['success']:
-                    successes += 1
-        return bool(true_values == successes)
+        with ThreadPoolExecutor(max_workers=len(to_remove) or 1) as executor:  # every social has its own request
+            successes = sum(bool(res['success']) for res in executor.map(lambda soc: remove_social_raw(self, soc), to_remove))
+        self._clear_socials_cache()
+        return bool(successes == len(to_remove))
 
     def switch_social_status(self: 'Me',
                              twitter: bool = None,
@@ -531,23 +638,32 @@ class Social:
         :return: is switch success (you get ``True`` even if social active or was un/hidden before).
         :rtype: ``bool``
         """
-        args = locals()
-        del args['self']
-        not_null_values = sum(True for i in args.values() if i is not None)
-        if not_null_values < 1:
+        args = dict(zip(_SOCIAL_NAMES, (twitter, spotify, instagram, facebook, tiktok, pinterest, linkedin)))
+        statuses = {soc: status for soc, status in args.items() if isinstance(status, bool)}
+        if not statuses:
             raise MeException("You need to switch status to at least one social!")
         successes = 0
+        to_switch = {}
         my_socials = self.get_socials()
-        for soc, status in args.items():
-            if status is not None and isinstance(status, bool):
-                is_active, is_hidden = attrgetter(f'{soc}.is_active', f'{soc}.is_hidden')(my_socials)
-                if not is_active or (not is_hidden and status) or (is_hidden and not status):
-                    successes += 1
-                    continue
-                else:
-                    if status != switch_social_status_raw(self, str(soc))['is_hidden']:
-                        successes += 1
-        return bool(not_null_values == successes)
+        for soc, status in statuses.items():
+            is_active, is_hidden = attrgetter(f'{soc}.is_active', f'{soc}.is_hidden')(my_socials)
+            if not is_active or (not is_hidden and status) or (is_hidden and not status):
+                successes += 1
+            else:
+                to_switch[soc] = status
+        if to_switch:
+            with ThreadPoolExecutor(max_workers=len(to_switch)) as executor:  # every social has its own request
+                results = executor.map(lambda soc: switch_social_status_raw(self, soc), to_switch)
+                successes += sum(status != res['is_hidden'] for status, res in zip(to_switch.values(), results))
+            self._clear_socials_cache()
+        return bool(successes == len(statuses))
+
+    def _clear_socials_cache(self: 'Me'):
+        """
+        Internal method to drop your cached socials after a change. The socials are also part of your profile.
+        """
+        self._socials_cache.clear()
+        self._profile_cache.pop(self.uuid)
 
     def numbers_count(self: 'Me') -> int:
         """
@@ -567,21 +683,7 @@ class Social:
         :return: Is request success.
         :rtype: ``bool``
         """
-        if isinstance(uuid, Profile):
-            if uuid.comments_enabled:
-                return True
-            uuid = uuid.uuid
-        if isinstance(uuid, User):
-            uuid = uuid.uuid
-        if isinstance(uuid, Contact):
-            if uuid.user:
-                uuid = uuid.user.uuid
-            else:
-                raise MeException("Contact has no user.")
-        if uuid == self.uuid:
-            raise MeException("You can't suggest to yourself!")
-
-        return suggest_turn_on_comments_raw(self, str(uuid))['requested']
+        return self._suggest_turn_on(uuid, suggest_turn_on_comments_raw, 'comments_enabled')
 
     def suggest_turn_on_mutual(self: 'Me', uuid: Union[str, Profile, User, Contact]) -> bool:
         """
@@ -592,21 +694,7 @@ class Social:
         :return: Is request success.
         :rtype: ``bool``
         """
-        if isinstance(uuid, Profile):
-            if uuid.mutual_contacts_available:
-                return True
-            uuid = uuid.uuid
-        if isinstance(uuid, User):
-            uuid = uuid.uuid
-        if isinstance(uuid, Contact):
-            if uuid.user:
-                uuid = uuid.user.uuid
-            else:
-                raise MeException("Contact has no user.")
-        if uuid == self.uuid:
-            raise MeException("You can't suggest to yourself!")
-
-        return suggest_turn_on_mutual_raw(self, str(uuid))['requested']
+        return self._suggest_turn_on(uuid, suggest_turn_on_mutual_raw, 'mutual_contacts_available')
 
     def suggest_turn_on_location(self: 'Me', uuid: Union[str, Profile, User, Contact]) -> bool:
         """
@@ -617,17 +705,27 @@ class Social:
         :return: Is request success.
         :rtype: ``bool``
         """
-        if isinstance(uuid, (Profile, User)):
+        return self._suggest_turn_on(uuid, suggest_turn_on_location_raw)
+
+    def _suggest_turn_on(self: 'Me', uuid: Union[str, Profile, User, Contact], raw_func, enabled_attr: str = None) -> bool:
+        """
+        Internal method for the ``suggest_turn_on_*`` methods, they differ only by the raw function.
+            - If a :py:obj:`~meapi.models.profile.Profile` already has ``enabled_attr`` on, no request is sent.
+        """
+        if isinstance(uuid, Profile):
+            if enabled_attr and getattr(uuid, enabled_attr):
+                return True
             uuid = uuid.uuid
-        if isinstance(uuid, Contact):
+        elif isinstance(uuid, User):
+            uuid = uuid.uuid
+        elif isinstance(uuid, Contact):
             if uuid.user:
                 uuid = uuid.user.uuid
             else:
                 raise MeException("Contact has no user.")
         if uuid == self.uuid:
             raise MeException("You can't suggest to yourself!")
-
-        return suggest_turn_on_location_raw(self, str(uuid))['requested']
+        return raw_func(self, str(uuid))['requested']
 
     def get_age(self: 'Me', uuid: Union[str, Profile, User, Contact] = None) -> int:
         """
@@ -649,13 +747,7 @@ class Social:
                 raise MeException("Contact has no user.")
         if uuid is None:
             uuid = self.uuid
-        profile = self.get_profile(uuid)
-        if profile.date_of_birth:
-            today = date.today()
-            if profile.date_of_birth > today:
-                return 0
-            return int((today - profile.date_of_birth).days / 365)
-        return 0
+        return self.get_profile(uuid).age
 
     def is_spammer(self: 'Me', phone_number: Union[int, str]) -> int:
         """
@@ -676,15 +768,19 @@ class Social:
         Update your location. See :py:func:`upload_random_data`.
 
         :param latitude: location latitude coordinates.
-        :type latitude: ``float``
+        :type latitude: ``float`` | ``int``
         :param longitude: location longitude coordinates.
-        :type longitude: ``float``
+        :type longitude: ``float`` | ``int``
         :return: Is location update success.
         :rtype: ``bool``
         """
-        if not isinstance(latitude, float) or not isinstance(longitude, float):
+        if isinstance(latitude, bool) or isinstance(longitude, bool) \
+                or not isinstance(latitude, (int, float)) or not isinstance(longitude, (int, float)) \
+                or not (-90 <= latitude <= 90 and -180 <= longitude <= 180):  # also false for nan and inf
             raise MeException("Not a valid coordination!")
-        return update_location_raw(self, latitude, longitude)['success']
+        res = update_location_raw(self, latitude, longitude)
+        self._profile_cache.pop(self.uuid)
+        return res['success']
 
     def share_location(self: 'Me', uuid: Union[str, Profile, User, Contact]) -> bool:
         """
@@ -704,6 +800,7 @@ class Social:
                 raise MeException("Contact has no user.")
         if uuid == self.uuid:
             raise MeException("You can't share location with yourself!")
+        self._profile_cache.pop(uuid)  # the profile has the sharing state
         return share_location_raw(self, uuid)['success']
 
     def stop_sharing_location(self: 'Me', uuids: Union[str, Profile, User, Contact, List[Union[str, Profile, User, Contact]]]) -> bool:
@@ -715,18 +812,9 @@ class Social:
         :return: is stopping success.
         :rtype: ``bool``
         """
-        if not isinstance(uuids, list):
-            uuids = [uuids]
-        if isinstance(uuids, list):
-            for uuid, index in enumerate(uuids):
-                if isinstance(uuid, (Profile, User)):
-                    uuids[index] = uuid.uuid
-                if isinstance(uuid, Contact):
-                    if uuid.user:
-                        uuids[index] = uuid.user.uuid
-                    else:
-                        _logger.warning(f"Skip contact {uuid.name} with no user.")
-
+        uuids = self._location_uuids(uuids)
+        for uuid in uuids:
+            self._profile_cache.pop(uuid)
         return stop_sharing_location_raw(self, uuids)['success']
 
     def stop_shared_location(self: 'Me', uuids: Union[str, Profile, User, Contact, List[Union[str, Profile, User, Contact]]]) -> bool:
@@ -738,20 +826,30 @@ class Social:
         :return: is stopping success.
         :rtype: ``bool``
         """
-        if not isinstance(uuids, list):
-            uuids = [uuids]
-        if isinstance(uuids, list):
-            for uuid, index in enumerate(uuids):
-                if isinstance(uuid, (Profile, User)):
-                    uuids[index] = uuid.uuid
-                if isinstance(uuid, Contact):
-                    if uuid.user:
-                        uuids[index] = uuid.user.uuid
-                    else:
-                        _logger.warning(f"Skip contact {uuid.name} with no user.")
-
+        uuids = self._location_uuids(uuids)
+        for uuid in uuids:
+            self._profile_cache.pop(uuid)
         return stop_shared_locations_raw(self, uuids)['success']
 
+    @staticmethod
+    def _location_uuids(uuids: Union[str, Profile, User, Contact, Iterable[Union[str, Profile, User, Contact]]]) -> List[str]:
+        """
+        Internal method to convert the ``uuids`` of :py:func:`stop_sharing_location` and :py:func:`stop_shared_location` to uuids.
+        """
+        if isinstance(uuids, (str, Profile, User, Contact)):  # a single one, any other iterable is taken as is
+            uuids = (uuids,)
+        results = []
+        for uuid in uuids:
+            if isinstance(uuid, (Profile, User)):
+                uuid = uuid.uuid
+            elif isinstance(uuid, Contact):
+                if not uuid.user:
+                    _logger.warning(f"Skip contact {uuid.name} with no user.")
+                    continue
+                uuid = uuid.user.uuid
+            results.append(str(uuid))
+        return results
+
     def locations_shared_by_me(self: 'Me') -> List[user.User]:
         """
         Get list of users that you shared your location with them.
@@ -759,7 +857,7 @@ class Social:
         :return: List of :py:obj:`~meapi.models.user.User` objects.
         :rtype: List[:py:obj:`~meapi.models.user.User`]
         """
-        return [user.User.new_from_dict(usr, _client=self) for usr in locations_shared_by_me_raw(self)]
+        return user.User.new_from_dicts(locations_shared_by_me_raw(self), _client=self)
 
     def locations_shared_with_me(self: 'Me') -> List[user.User]:
         """
@@ -368,8 +368,20 @@ def suspend_account_raw(client: 'Me') -> dict:
     return client._make_request('put', '/main/settings/suspend-user/')
 
 
-def _contact_handler(client: 'Me', to_add: bool, contacts: List[dict]) -> dict:
-    body = {"add": contacts if to_add else [], "is_first": False, "remove": contacts if not to_add else []}
+def sync_contacts_raw(client: 'Me', add: List[dict] = (), remove: List[dict] = ()) -> dict:
+    """
+    Add and remove contacts from your Me account in one request.
+
+    :param client: :py:obj:`~meapi.Me` client object.
+    :type client: :py:obj:`~meapi.Me`
+    :param add: List of contacts to add. See :py:func:`add_contacts_raw`.
+    :type add: List[``dict``]
+    :param remove: List of contacts to remove. See :py:func:`remove_contacts_raw`.
+    :type remove: List[``dict``]
+    :rtype: ``dict``
+    """
+    # the empty side is the shared immutable tuple default (serialized as []), no new list per call.
+    body = {"add": add, "is_first": False, "remove": remove}
     return client._make_request('post', '/main/contacts/sync/', body)
 
 
@@ -417,7 +429,7 @@ def add_contacts_raw(client: 'Me', contacts: List[dict]) -> dict:
             'failed_contacts': []
         }
     """
-    return _contact_handler(client, to_add=True, contacts=contacts)
+    return sync_contacts_raw(client, add=contacts)
 
 
 def remove_contacts_raw(client: 'Me', contacts: List[dict]) -> dict:
@@ -457,7 +469,7 @@ def remove_contacts_raw(client: 'Me', contacts: List[dict]) -> dict:
     Args:
         contacts:
     """
-    return _contact_handler(client, to_add=False, contacts=contacts)
+    return sync_contacts_raw(client, remove=contacts)
 
 
 def block_profile_raw(client: 'Me', phone_number: int, block_contact: bool, me_full_block: bool) -> dict:
@@ -508,8 +520,7 @@ def unblock_profile_raw(client: 'Me', phone_number: int, unblock_contact=True, m
             'message': 'Successfully block  updated'
         }
     """
-    body = {"block_contact": not unblock_contact, "me_full_block": not me_full_unblock, "phone_number": phone_number}
-    return client._make_request('post', '/main/users/profile/block/', body)
+    return block_profile_raw(client, phone_number, block_contact=not unblock_contact, me_full_block=not me_full_unblock)
 
 
 def block_numbers_raw(client: 'Me', numbers: List[int]) -> dict:
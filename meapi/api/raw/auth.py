@@ -73,8 +73,7 @@ def ask_for_call_raw(client: 'Me', phone_number: str, session_token: str) -> dic
         }
     """
     body = {"activation_type": "failb", "device_type": "android", "phone_number": phone_number}
-    headers = HEADERS
-    headers['session-token'] = session_token
+    headers = {**HEADERS, 'session-token': session_token}  # a copy, HEADERS is shared by all the requests
     return client._make_request(req_type='post', endpoint='/auth/authorization/verify/', headers=headers, body=body)
 
 
@@ -100,6 +99,5 @@ def ask_for_sms_raw(client: 'Me', phone_number: str, session_token: str) -> dict
         }
     """
     body = {"activation_type": "sms", "device_type": "android", "app_token": "", "phone_number": phone_number}
-    headers = HEADERS
-    headers['session-token'] = session_token
+    headers = {**HEADERS, 'session-token': session_token}  # a copy, HEADERS is shared by all the requests
     return client._make_request(req_type='post', endpoint='/auth/authorization/verify/', headers=headers, body=body)
@@ -107,7 +107,7 @@ def get_notifications_raw(client: 'Me', page_number: int, results_limit: int, ca
     params = f"?page={page_number}&page_size={results_limit}&status=distributed"
     if categories:
         params += f"&categories=%5B{'%2C%20'.join(categories)}%5D"
-    return client._make_request('get', '/notification/notification/items/' + params)
+    return client._make_request('get', f'/notification/notification/items/{params}')
 
 
 def read_notification_raw(client: 'Me', notification_id: int) -> dict:
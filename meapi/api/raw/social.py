@@ -701,7 +701,7 @@ def add_social_token_raw(client: 'Me', social_name: str, token: str) -> dict:
             "success": True
         }
     """
-    return client.self._make_request('post', f'/main/social/save-auth-token/', {'social_name': social_name, 'code_first': token})
+    return client._make_request('post', f'/main/social/save-auth-token/', {'social_name': social_name, 'code_first': token})
 
 
 def add_social_url_raw(client: 'Me', social_name: str, url: str) -> dict:
@@ -1,13 +1,15 @@
-from re import match
+from threading import RLock
 from typing import Union
 from requests import Session
 from meapi.api.client.account import Account
 from meapi.api.client.notifications import Notifications
 from meapi.api.client.settings import Settings
 from meapi.api.client.social import Social
-from meapi.api.client.auth import Auth
+from meapi.api.client.auth import Auth, _ACTIVATION_CODE_RE
+from meapi.utils.cache import TTLCache
 from meapi.utils.credentials_managers import CredentialsManager, JsonFileCredentialsManager
 from meapi.utils.exceptions import MeException
+from meapi.utils.helpers import _new_session
 from meapi.utils.validations import validate_phone_number, validate_auth_response
 from logging import getLogger
 
@@ -98,7 +100,7 @@ class Me(Auth, Account, Social, Settings, Notifications):
 
         # validate pre-activation-code
         if activation_code:
-            if not match(r'^\d{6}$', str(activation_code)):
+            if not _ACTIVATION_CODE_RE.fullmatch(str(activation_code)):
                 raise MeException("Not a valid 6-digits activation code!")
         self._activation_code = activation_code
 
@@ -122,7 +124,14 @@ class Me(Auth, Account, Social, Settings, Notifications):
         self._access_token = access_token
         self._account_details = account_details
         self._proxies = proxies
-        self._session: Session = session or Session()  # create new session if not provided
+        self._session: Session = session or _new_session()  # create new session if not provided
+        self._token_lock = RLock()  # one access token refresh at a time, the concurrent methods share the client
+        self._search_cache = TTLCache()  # phone_search results by phone number
+        self._profile_cache = TTLCache()  # get_profile results by uuid
+        self._blocked_numbers_cache = TTLCache(maxsize=1, ttl=30)
+        self._settings_cache = TTLCache(maxsize=1, ttl=30)  # get_settings response
+        self._socials_cache = TTLCache(maxsize=1, ttl=30)  # get_socials response of your account
+        self._groups_cache = None  # get_groups response, set only inside cached_groups()
 
         # if access_token not provided, try to get it from the credentials manager, if not found, activate the account.
         if not self._access_token:
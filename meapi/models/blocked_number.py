@@ -41,14 +41,14 @@ class BlockedNumber(MeModel):
         Unblock this number.
             - Same as :py:func:`~meapi.Me.unblock_profile`.
         """
-        if self.__client.unblock_profile(self.phone_number, me_full_unblock, unblock_contact):
-            self.block_contact = False
-            self.me_full_block = False
+        if self.__client.unblock_profile(self.phone_number, unblock_contact=unblock_contact, me_full_unblock=me_full_unblock):
+            self.block_contact = self.block_contact and not unblock_contact
+            self.me_full_block = self.me_full_block and not me_full_unblock
             return True
         return False
 
     def __setattr__(self, key, value):
-        if getattr(self, '_BlockedNumber__init_done', None) and key != "phone_number":
+        if self.__dict__.get('_BlockedNumber__init_done') and key not in ['block_contact', 'me_full_block']:
             raise MeException(f"{key} cannot be changed!")
         super().__setattr__(key, value)
 
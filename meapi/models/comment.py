@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, List, TYPE_CHECKING
 from meapi.utils.exceptions import MeException
 from meapi.utils.helpers import parse_date
 from meapi.models.me_model import MeModel
@@ -78,12 +78,34 @@ class Comment(MeModel):
         self.profile_uuid = profile_uuid
         self.comments_blocked = comments_blocked
         self.created_at: Optional[datetime] = parse_date(created_at)
-        self.comment_likes = [User.new_from_dict(user['author']) for user in
-                              comment_likes] if comment_likes else None
+        self.__comment_likes_raw = comment_likes  # the users are created only if comment_likes is accessed
         self.__client = _client
         self.__my_comment = _my_comment
         self.__init_done = True
 
+    @property
+    def comment_likes(self) -> Optional[List[User]]:
+        """
+        The list of users who liked the comment. Created on first access.
+        """
+        if '_Comment__comment_likes' not in self.__dict__:
+            self.__dict__['_Comment__comment_likes'] = [User.new_from_dict(user['author']) for user in
+                                                       self.__comment_likes_raw] if self.__comment_likes_raw else None
+        return self.__dict__['_Comment__comment_likes']
+
+    @comment_likes.setter
+    def comment_likes(self, value: Optional[List[User]]):
+        self.__dict__['_Comment__comment_likes'] = value
+
+    def as_dict(self) -> dict:
+        """
+        Return class data as ``dict``, with the lazy ``comment_likes``.
+        """
+        data = super().as_dict()
+        comment_likes = self.comment_likes
+        data['comment_likes'] = [usr.as_dict() for usr in comment_likes] if comment_likes is not None else None
+        return data
+
     def approve(self) -> bool:
         """
         Approve the comment.
@@ -190,7 +212,7 @@ class Comment(MeModel):
         return self.__client.publish_comment(self.profile_uuid, your_comment)
 
     def __setattr__(self, key, value):
-        if getattr(self, '_Comment__init_done', None):
+        if self.__dict__.get('_Comment__init_done'):
             if key not in ['message', 'status', 'like_count', 'comment_likes']:
                 raise MeException("You can't change this attr!")
         return super().__setattr__(key, value)
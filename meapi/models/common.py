@@ -1,5 +1,5 @@
 from functools import reduce
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Union, Optional
 from meapi.utils.exceptions import MeException
 from meapi.utils.helpers import get_img_binary_content, encode_string
 
@@ -125,30 +125,37 @@ class _CommonMethodsForUserContactProfile:
             NOTE;CHARSET=UTF-8;ENCODING=QUOTED-PRINTABLE:Twitter: RachelGreeen | Gender: F
             END:VCARD
         """
-        vcard_data = {'start': "BEGIN:VCARD", 'version': "VERSION:3.0"}
-        full_name = ((str(prefix_name) + ' - ') if prefix_name else '') + (self.name or f'Unknown - {self.phone_number}')
-        vcard_data['name'] = f"FN;CHARSET=UTF-8;ENCODING=QUOTED-PRINTABLE:{encode_string(full_name)}"
-        vcard_data['phone'] = f"TEL;CELL:{self.phone_number}"
-        if dl_profile_picture and getattr(self, 'profile_picture', None):
-            binary = get_img_binary_content(self.profile_picture)
-            if binary:
-                vcard_data['photo'] = f"PHOTO;ENCODING=BASE64;JPEG:{binary}"
-        if getattr(self, 'email', None):
-            vcard_data['email'] = f"EMAIL:{self.email}"
-        if getattr(self, 'date_of_birth', None):
-            vcard_data['birthday'] = f"BDAY:{self.date_of_birth}"
-
-        notes = 'Extracted with meapi <https://github.com/david-lev/meapi>' if not kwargs.get('remove_credit', False) else ''
-        for key, value in kwargs.items():
-            try:
-                attr_value = reduce(getattr, value.split('.'), self)
-                if attr_value and isinstance(attr_value, (str, int)):
-                    notes += f" | {str(key).replace('_', ' ').title()}: {attr_value}"
-            except AttributeError:
-                continue
-
-        vcard_data['note'] = f"NOTE;CHARSET=UTF-8;ENCODING=QUOTED-PRINTABLE:{encode_string(notes)}"
-        vcard_data['end'] = "END:VCARD"
-
-        return "\n".join([val for val in vcard_data.values()])
+        profile_picture = getattr(self, 'profile_picture', None) if dl_profile_picture else None
+        return _build_vcard(self, prefix_name, get_img_binary_content(profile_picture) if profile_picture else None, kwargs)
 
+
+def _build_vcard(obj: Union['Profile', 'User', 'Contact'], prefix_name: str, profile_picture: Optional[str], kwargs: dict) -> str:
+    """
+    Internal function to build the vcard of :py:func:`~meapi.models.common._CommonMethodsForUserContactProfile.as_vcard`.
+        - ``profile_picture`` is the already downloaded base64 image, so many pictures can be downloaded together (See :py:func:`~meapi.Me.get_vcards`).
+    """
+    full_name = ((str(prefix_name) + ' - ') if prefix_name else '') + (obj.name or f'Unknown - {obj.phone_number}')
+    lines = ["BEGIN:VCARD", "VERSION:3.0",
+             f"FN;CHARSET=UTF-8;ENCODING=QUOTED-PRINTABLE:{encode_string(full_name)}",
+             f"TEL;CELL:{obj.phone_number}"]
+    if profile_picture:
+        lines.append(f"PHOTO;ENCODING=BASE64;JPEG:{profile_picture}")
+    email = getattr(obj, 'email', None)
+    if email:
+        lines.append(f"EMAIL:{email}")
+    date_of_birth = getattr(obj, 'date_of_birth', None)
+    if date_of_birth:
+        lines.append(f"BDAY:{date_of_birth}")
+
+    notes = ['Extracted with meapi <https://github.com/david-lev/meapi>' if not kwargs.get('remove_credit', False) else '']
+    for key, value in kwargs.items():
+        try:
+            attr_value = reduce(getattr, value.split('.'), obj)
+            if attr_value and isinstance(attr_value, (str, int)):
+                notes.append(f"{str(key).replace('_', ' ').title()}: {attr_value}")
+        except AttributeError:
+            continue
+
+    lines.append(f"NOTE;CHARSET=UTF-8;ENCODING=QUOTED-PRINTABLE:{encode_string(' | '.join(notes))}")
+    lines.append("END:VCARD")
+    return "\n".join(lines)
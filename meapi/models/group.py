@@ -116,7 +116,7 @@ class Group(MeModel):
         return False
 
     def __setattr__(self, key, value):
-        if getattr(self, '_Group__init_done', None):
+        if self.__dict__.get('_Group__init_done'):
             if key != 'is_active':
                 raise MeException("You can't change this attr!")
         return super().__setattr__(key, value)
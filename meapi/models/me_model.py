@@ -1,29 +1,38 @@
-import inspect
 import json
 from abc import ABCMeta
 from typing import TYPE_CHECKING
 from datetime import datetime, date
 from meapi.utils.exceptions import MeException
-from logging import getLogger
+from logging import getLogger, WARNING
+try:
+    import orjson
+except ImportError:  # orjson is optional, fallback to the standard json module.
+    orjson = None
 if TYPE_CHECKING:  # always False at runtime.
     from meapi import Me
 
-IGNORED_KEYS = []
+IGNORED_KEYS = set()
 _logger = getLogger(__name__)
 
 
 class _ParameterReader(ABCMeta):
     """Internal class to get class init parameters"""
-    def __init__(cls, *args, **kwargs):
-        parameters = inspect.signature(cls.__init__).parameters
-        parameters = {key: value for key, value in parameters.items() if key not in ['self', 'args', 'kwargs']}
-        try:
-            cls._init_parameters = cls.__bases__[0]._init_parameters.copy()
-            cls._init_parameters.update(parameters)
-        except AttributeError:
-            cls._init_parameters = parameters
-
-        super().__init__(*args, **kwargs)
+    @property
+    def _init_parameters(cls) -> dict:
+        """
+        The names of the class init parameters (with the parameters of the base class).
+            - Computed on first use and kept on the class, models that are never created cost nothing on import.
+        """
+        parameters = cls.__dict__.get('_init_parameters_cache')
+        if parameters is None:
+            code = cls.__init__.__code__  # cheaper than inspect.signature, only the names are needed.
+            names = code.co_varnames[:code.co_argcount + code.co_kwonlyargcount]
+            parameters = dict.fromkeys(name for name in names if name != 'self')
+            base_parameters = getattr(cls.__bases__[0], '_init_parameters', None)
+            if base_parameters:
+                parameters = {**base_parameters, **parameters}
+            cls._init_parameters_cache = parameters
+        return parameters
 
 
 class MeModel(metaclass=_ParameterReader):
@@ -57,58 +66,86 @@ class MeModel(metaclass=_ParameterReader):
         """
         Return class data as ``dict``.
         """
-        data = {}
+        cache = self.__dict__.get('_MeModel__as_dict_cache')
+        if cache is None:
+            cache = self.__dict__['_MeModel__as_dict_cache'] = self.__build_as_dict_cache()
+        scalars, nested_keys = cache
+        data = scalars.copy()
+        attrs = self.__dict__
+        for key in nested_keys:  # sub-objects and lists can change in place, always serialize them again.
+            value = attrs[key]
+            if isinstance(value, (list, tuple, set)):
+                data[key] = [subobj.as_dict() if getattr(subobj, 'as_dict', None) else subobj for subobj in value]
+            else:
+                data[key] = value.as_dict()
+        return data
+
+    def __build_as_dict_cache(self) -> tuple:
+        """
+        Split the public attrs to the converted scalar values and the keys of sub-objects and lists.
+            - The scalars are kept until the next attr change (see ``__setattr__``).
+        """
+        scalars, nested_keys = {}, []
         for (key, value) in self.__dict__.items():
-            if str(key).startswith("_"):
+            if key[0] == "_":  # __dict__ keys are always non-empty str
                 continue
-            elif isinstance(getattr(self, key, None), (list, tuple, set)):
-                data[key] = list()
-                for subobj in getattr(self, key, None):
-                    if getattr(subobj, 'as_dict', None):
-                        data[key].append(subobj.as_dict())
-                    else:
-                        data[key].append(subobj)
-            elif getattr(getattr(self, key, None), 'as_dict', None):
-                data[key] = getattr(self, key).as_dict()
-
+            if isinstance(value, (list, tuple, set)) or getattr(value, 'as_dict', None):
+                scalars[key] = None  # placeholder, keeps the keys order
+                nested_keys.append(key)
             elif isinstance(value, (date, datetime)):
-                data[key] = str(getattr(self, key, None))
+                scalars[key] = str(value)
             else:
-                data[key] = getattr(self, key, None)
-        return data
+                scalars[key] = value
+        return scalars, tuple(nested_keys)
 
-    def as_json(self, ensure_ascii=True) -> str:
+    def as_json(self, ensure_ascii=False) -> str:
         """
         Return class data in ``json`` format.
+            - Non-ASCII characters (names, emojis etc.) are kept as is, pass ``ensure_ascii=True`` to escape them.
+            - Compact output (without spaces) with sorted keys. Without ``ensure_ascii``, ``orjson`` is used if installed, the output is the same.
         """
-        return json.dumps(self.as_dict(), ensure_ascii=ensure_ascii, sort_keys=True)
+        if orjson is not None and not ensure_ascii:
+            return orjson.dumps(self.as_dict(), option=orjson.OPT_SORT_KEYS).decode('utf-8')
+        return json.dumps(self.as_dict(), ensure_ascii=ensure_ascii, sort_keys=True, separators=(',', ':'))
 
     @classmethod
     def new_from_dict(cls, data: dict, _client: 'Me' = None, **kwargs):
         """
         Create new instance from dict.
+            - ``data`` is not modified, so cached api responses can be passed as is.
+        """
+        return cls._new_from_dict(cls._init_parameters, data, _client, kwargs)
+
+    @classmethod
+    def new_from_dicts(cls, items: list, _client: 'Me' = None, **kwargs) -> list:
+        """
+        Create new instances from a list of dicts, same as :py:meth:`new_from_dict` on each one.
+            - The class parameters are looked up once for the whole list.
+        """
+        cls_attrs = cls._init_parameters
+        return [cls._new_from_dict(cls_attrs, data, _client, kwargs) for data in items]
+
+    @classmethod
+    def _new_from_dict(cls, cls_attrs: dict, data: dict, _client: 'Me', kwargs: dict):
+        """
+        Internal method to create new instance from dict. Used by :py:meth:`new_from_dict` and :py:meth:`new_from_dicts`.
         """
-        if not data or data is None:
+        if not data:
             return None
-        cls_attrs = cls._init_parameters.keys()
-        if '_client' in cls_attrs:
-            data['_client'] = _client
-        json_data = data.copy()
         if kwargs:
-            for key, val in kwargs.items():
-                json_data[key] = val
-        global IGNORED_KEYS
-        for key in json_data.copy():
-            if key not in cls_attrs:
-                if key not in IGNORED_KEYS and not key.startswith('_'):
-                    IGNORED_KEYS.append(key)
-                    msg = f"- {cls.__name__}: The key '{key}' with the value of '{json_data[key]}' just skipped. " \
+            data = {**data, **kwargs}
+        json_data = {key: value for key, value in data.items() if key in cls_attrs}
+        if len(json_data) != len(data) and _logger.isEnabledFor(WARNING):  # report the new keys, only when there are any.
+            for key, value in data.items():
+                if key not in cls_attrs and key not in IGNORED_KEYS and not key.startswith('_'):
+                    IGNORED_KEYS.add(key)
+                    msg = f"- {cls.__name__}: The key '{key}' with the value of '{value}' just skipped. " \
                           f"Try to update meapi to the latest version (pip3 install -U meapi) " \
                           f"If it's still skipping, open issue in github: <https://github.com/david-lev/meapi/issues>"
                     _logger.warning(msg)
-                del json_data[key]
-        c = cls(**json_data)
-        return c
+        if '_client' in cls_attrs and '_client' not in kwargs:
+            json_data['_client'] = _client
+        return cls(**json_data)
 
     def __getitem__(self, item):
         """
@@ -138,8 +175,9 @@ class MeModel(metaclass=_ParameterReader):
         """
         Prevent attr changes after the init in protected data classes
         """
-        if getattr(self, '_MeModel__init_done', None):
+        if self.__dict__.get('_MeModel__init_done'):
             raise MeException(f"You cannot change protected attr '{key}' of '{self.__class__.__name__}'!")
+        self.__dict__.pop('_MeModel__as_dict_cache', None)  # as_dict must see the new value
         return super().__setattr__(key, value)
 
     def __str__(self) -> str:
@@ -152,7 +190,13 @@ class MeModel(metaclass=_ParameterReader):
         """
         Return True if the two objects are equal.
         """
-        return other and self.as_dict() == other.as_dict()
+        if other is self:
+            return True
+        if type(other) is not type(self):
+            return False
+        if getattr(self, 'id', None) != getattr(other, 'id', None):  # cheap check before comparing all the data
+            return False
+        return self.as_dict() == other.as_dict()
 
     def __ne__(self, other) -> bool:
         """
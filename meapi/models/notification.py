@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from meapi.models.me_model import MeModel
 from meapi.utils.exceptions import MeException
-from meapi.utils.helpers import parse_date
+from meapi.utils.helpers import parse_date, intern_str
 if TYPE_CHECKING:  # always False at runtime.
     from meapi import Me
 
@@ -102,13 +102,13 @@ class Notification(MeModel):
         self.modified_at: datetime = parse_date(modified_at)
         self.is_read = is_read
         self.sender = sender
-        self.status = status
-        self.delivery_method = delivery_method
+        self.status = intern_str(status)
+        self.delivery_method = intern_str(delivery_method)
         self.distribution_date: datetime = parse_date(distribution_date)
         self.message_subject = message_subject
-        self.category = message_category or category
+        self.category = intern_str(message_category or category)
         self.message_body = message_body
-        self.message_lang = message_lang
+        self.message_lang = intern_str(message_lang)
         # context:
         self.name = name
         self.uuid = uuid
@@ -120,7 +120,7 @@ class Notification(MeModel):
         self.__init_done = True
 
     def __setattr__(self, key, value):
-        if getattr(self, '_Notification__init_done', None):
+        if self.__dict__.get('_Notification__init_done'):
             if key != 'is_read':
                 raise MeException("You can't change this attr!")
         return super().__setattr__(key, value)
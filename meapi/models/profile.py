@@ -1,8 +1,7 @@
-from copy import deepcopy
 from datetime import date
 from typing import List, Union, TYPE_CHECKING, Optional
 from meapi.utils.exceptions import MeException
-from meapi.utils.helpers import parse_date
+from meapi.utils.helpers import parse_date, intern_str
 from meapi.models.comment import Comment
 from meapi.models.common import _CommonMethodsForUserContactProfile
 from meapi.models.deleter import Deleter
@@ -13,6 +12,9 @@ from meapi.models.watcher import Watcher
 if TYPE_CHECKING:  # always False at runtime.
     from meapi import Me
 
+_MODIFIABLE_ATTRS = frozenset(('first_name', 'last_name', 'email', 'gender', 'slogan', 'profile_picture', 'date_of_birth',
+                               'location_name', 'device_type', 'login_type', 'facebook_url', 'google_url', 'carrier'))
+
 
 class Profile(MeModel, _CommonMethodsForUserContactProfile):
     """
@@ -222,24 +224,24 @@ class Profile(MeModel, _CommonMethodsForUserContactProfile):
         self.is_he_blocked_me = is_he_blocked_me
         self.is_permanent = is_permanent
         self.is_shared_location = is_shared_location
-        self.last_comment = Comment.new_from_dict(last_comment, _client=_client, profile_uuid=uuid)
+        self.__last_comment_raw = last_comment  # last_comment and social are created only if accessed
         self.mutual_contacts_available = mutual_contacts_available
-        self.mutual_contacts: List[User] = [User.new_from_dict(mutual_contact['referenced_user']) for mutual_contact in
-                                            mutual_contacts] if mutual_contacts_available else mutual_contacts
+        self.mutual_contacts: List[User] = User.new_from_dicts(
+            [mutual_contact['referenced_user'] for mutual_contact in mutual_contacts]) if mutual_contacts_available else mutual_contacts
         self.share_location = share_location
-        self.social: Social = Social.new_from_dict(social, _client=_client, _my_social=_my_profile) if social else social
+        self.__social_raw = social
         self.carrier = carrier
         self.comments_enabled = comments_enabled
-        self.country_code = country_code
+        self.country_code = intern_str(country_code)
         self.date_of_birth: Optional[date] = parse_date(date_of_birth, date_only=True)
-        self.device_type = device_type
+        self.device_type = intern_str(device_type)
         self.distance = distance
-        self.friends_distance = [User.new_from_dict(user.get('author')) for user in friends_distance.get('friends')] if friends_distance else None
+        self.friends_distance = User.new_from_dicts([user.get('author') for user in friends_distance.get('friends')]) if friends_distance else None
         self.email = email
         self.facebook_url = f"https://facebook.com/profile.php?id={facebook_url}" if facebook_url else facebook_url
         self.first_name = first_name
         self.gdpr_consent = gdpr_consent
-        self.gender = gender
+        self.gender = intern_str(gender)
         self.google_url = google_url
         self.is_premium = is_premium
         self.is_verified = is_verified
@@ -248,19 +250,19 @@ class Profile(MeModel, _CommonMethodsForUserContactProfile):
         self.location_longitude = location_longitude
         self.location_latitude = location_latitude
         self.location_name = location_name
-        self.login_type = login_type
+        self.login_type = intern_str(login_type)
         self.me_in_contacts = me_in_contacts
         self.phone_number = phone_number
         self.phone_prefix = phone_prefix
         self.profile_picture = profile_picture
         self.slogan = slogan
-        self.user_type = user_type
+        self.user_type = intern_str(user_type)
         self.uuid = uuid
         self.verify_subscription = verify_subscription
         self.who_deleted_enabled = who_deleted_enabled
-        self.who_deleted = [Deleter.new_from_dict(deleter) for deleter in who_deleted] if who_deleted else None
+        self.who_deleted = Deleter.new_from_dicts(who_deleted) if who_deleted else None
         self.who_watched_enabled = who_watched_enabled
-        self.who_watched = [Watcher.new_from_dict(watcher) for watcher in who_watched] if who_watched else None
+        self.who_watched = Watcher.new_from_dicts(who_watched) if who_watched else None
         self.__my_profile = _my_profile
 
     @property
@@ -285,9 +287,42 @@ class Profile(MeModel, _CommonMethodsForUserContactProfile):
         """
         Calculates the age of the user from ``date_of_birth``.
         """
-        if not self.date_of_birth or self.date_of_birth > date.today():
+        date_of_birth, today = self.date_of_birth, date.today()
+        if not date_of_birth or date_of_birth > today:
             return 0
-        return (date.today() - self.date_of_birth).days // 365
+        # whole years by the calendar, days // 365 was a day off for every 4 years of age.
+        return today.year - date_of_birth.year - ((today.month, today.day) < (date_of_birth.month, date_of_birth.day))
+
+    @property
+    def last_comment(self) -> Optional[Comment]:
+        """
+        The last comment on the profile. Created on first access.
+        """
+        if '_Profile__last_comment' not in self.__dict__:
+            self.__dict__['_Profile__last_comment'] = Comment.new_from_dict(self.__last_comment_raw, _client=self.__client,
+                                                                            profile_uuid=self.uuid)
+        return self.__dict__['_Profile__last_comment']
+
+    @property
+    def social(self) -> Optional[Social]:
+        """
+        The user's social media networks. Created on first access.
+        """
+        if '_Profile__social' not in self.__dict__:
+            social = self.__social_raw
+            self.__dict__['_Profile__social'] = Social.new_from_dict(social, _client=self.__client,
+                                                                     _my_social=bool(self.__my_profile)) if social else social
+        return self.__dict__['_Profile__social']
+
+    def as_dict(self) -> dict:
+        """
+        Return class data as ``dict``, with the lazy ``last_comment`` and ``social``.
+        """
+        data = super().as_dict()
+        last_comment, social = self.last_comment, self.social
+        data['last_comment'] = last_comment.as_dict() if last_comment is not None else None
+        data['social'] = social.as_dict() if social else social
+        return data
 
     def refresh(self) -> bool:
         """
@@ -295,21 +330,20 @@ class Profile(MeModel, _CommonMethodsForUserContactProfile):
             - You don't need to call this method if you change the profile by assigning a new value to the attrs (If i'ts your profile).
         """
         self.__my_profile = None  # __setattr__ relies on it to prevent changes
-        self.__dict__ = deepcopy(self.__client.get_profile(self.uuid).__dict__)
+        self.__client._profile_cache.pop(self.uuid)  # get fresh data from the server
+        self.__dict__ = self.__client.get_profile(self.uuid).__dict__  # a new object, no need to copy it
         if self.__my_profile:
             return True
         return False
 
     def __setattr__(self, key, value):
-        if getattr(self, '_Profile__my_profile', None) is not None:
-            if self.__my_profile:
+        my_profile = self.__dict__.get('_Profile__my_profile')
+        if my_profile is not None:
+            if my_profile:
                 if key == '_Profile__my_profile' or key == 'name':
                     return super().__setattr__(key, value)
-                modifiable_attrs = ['first_name', 'last_name', 'email', 'gender', 'slogan', 'profile_picture',
-                                    'date_of_birth', 'location_name', 'device_type', 'login_type', 'facebook_url',
-                                    'google_url', 'carrier']
-                if key not in modifiable_attrs:
-                    raise MeException(f"You can not modify this attr!\nThe modifiable attrs are: {modifiable_attrs}")
+                if key not in _MODIFIABLE_ATTRS:
+                    raise MeException(f"You can not modify this attr!\nThe modifiable attrs are: {sorted(_MODIFIABLE_ATTRS)}")
                 success, new_profile = self.__client.update_profile_details(**{key: value})
                 if (success and str(getattr(new_profile, key, None)) == str(value)) or key == 'profile_picture':
                     # Can't check if profile picture updated because Me convert's it to their own url.
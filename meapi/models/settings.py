@@ -123,7 +123,7 @@ class Settings(MeModel):
         return f"<Settings lang={self.language}>"
 
     def __setattr__(self, key, value):
-        if getattr(self, '_Settings__init_done', None):
+        if self.__dict__.get('_Settings__init_done'):
             if key not in ['spammers_count', 'last_backup_at', 'last_restore_at', 'contact_suspended']:
                 if key == 'language':
                     if isinstance(value, str) and len(value) == 2 and value.isalpha():
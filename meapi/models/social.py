@@ -1,4 +1,3 @@
-import copy
 from datetime import datetime
 from typing import List, Optional, TYPE_CHECKING
 from meapi.utils.exceptions import MeException
@@ -120,7 +119,7 @@ class SocialMediaAccount(MeModel):
                  is_hidden: bool = None,
                  ):
         self.name = name
-        self.posts: Optional[List[Post]] = [Post.new_from_dict(post) for post in posts] if posts else posts
+        self.posts: Optional[List[Post]] = Post.new_from_dicts(posts) if posts else posts
         self.profile_id = profile_id
         self.is_active = is_active
         self.is_hidden = is_hidden
@@ -133,7 +132,7 @@ class SocialMediaAccount(MeModel):
         return social_profile_urls[self.name].format(self.profile_id) if self.profile_id else self.profile_id
 
     def __setattr__(self, key, value):
-        if getattr(self, '_SocialMediaAccount__init_done', None):
+        if self.__dict__.get('_SocialMediaAccount__init_done'):
             if not self.__my_social:
                 raise MeException(f"You cannot change social of another user!")
         return super().__setattr__(key, value)
@@ -161,7 +160,7 @@ class SocialMediaAccount(MeModel):
             raise MeException(f"You cannot add social to another user!")
         key = f'{self.name}_url' if self.name in ['linkedin', 'pinterest'] else f'{self.name}_token'
         if self.__client.add_social(**{key: token_or_url}):
-            self.__dict__ = copy.deepcopy(getattr(self.__client.get_socials(), self.name).__dict__)
+            self.__dict__ = getattr(self.__client.get_socials(), self.name).__dict__  # a new object, no need to copy it
             return True
         return False
 
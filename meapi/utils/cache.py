@@ -0,0 +1,68 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """
+    Simple in-memory cache with a maximum size and a time-to-live for every entry.
+        - Used by the ``Me`` client to skip repeated api calls for the same data.
+        - When the cache is full, the least recently used entry is dropped.
+
+    :param maxsize: Maximum number of entries to keep. *Default:* ``1024``.
+    :type maxsize: ``int``
+    :param ttl: Seconds to keep every entry. *Default:* ``300``.
+    :type ttl: ``float``
+    """
+    def __init__(self, maxsize: int = 1024, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the value of ``key`` if it exists and not expired, else ``default``.
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at <= monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        """
+        Store ``value`` under ``key`` for the next ``ttl`` seconds.
+        """
+        with self._lock:
+            self._data[key] = (monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Remove ``key`` from the cache and return its value, or ``default`` if not exists.
+        """
+        with self._lock:
+            item = self._data.pop(key, None)
+        return default if item is None else item[1]
+
+    def clear(self):
+        """
+        Remove all the entries from the cache.
+        """
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, self) is not self
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,19 +1,51 @@
-from time import time, localtime, strftime, mktime, strptime
+from time import time, localtime, strftime
 from base64 import b64encode
-from datetime import datetime, date
-from quopri import encodestring
-from random import randint, choice, uniform, random
-from re import sub
-from typing import Union, Optional
-from requests import get
+from concurrent.futures import ThreadPoolExecutor
+from json import dumps, loads
+from datetime import datetime, date, timezone
+from binascii import b2a_qp
+from random import randint, choice, choices, uniform, random
+from re import compile
+from functools import lru_cache
+from typing import Union, Optional, Tuple, Iterable, Dict
+from requests import Session
+from requests.adapters import HTTPAdapter, Retry
 from meapi.utils.exceptions import MeException
 from string import ascii_letters, digits
 from hashlib import sha256
 from os import urandom, path
+from sys import intern
 from meapi.api.raw.account import upload_image_raw
+try:
+    import orjson
+except ImportError:  # orjson is optional, fallback to the standard json module.
+    orjson = None
 
 RANDOM_API = "https://random-data-api.com/api"
 HEADERS = {'accept-encoding': 'gzip', 'user-agent': 'okhttp/4.9.1', 'content-type': 'application/json; charset=UTF-8'}
+_IMG_CHUNK_SIZE = 64 * 1024
+_NON_DIGITS_RE = compile(r'\D')
+_POOL_MAXSIZE = 20  # enough keep-alive connections for the concurrent client methods (phone_search_many etc.)
+
+
+def _new_session() -> Session:
+    """
+    Internal function to create a ``requests.Session`` that keeps enough connections alive for concurrent requests.
+        - Failed connection attempts are retried, the request itself was not sent yet so it is safe for ``post`` too.
+    """
+    session = Session()
+    retries = Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.3)
+    session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=_POOL_MAXSIZE, max_retries=retries))
+    return session
+
+
+@lru_cache(maxsize=1)
+def _download_session() -> Session:
+    """
+    Internal shared session for requests outside the api (profile pictures, image urls, random data).
+        - Created on first use, keeps the connections to the same hosts alive between calls.
+    """
+    return _new_session()
 
 
 def _upload_picture(client: 'Me', image: str) -> str:
@@ -31,75 +63,153 @@ def _upload_picture(client: 'Me', image: str) -> str:
         with open(image, 'rb') as f:
             image_data = f.read()
     else:
-        image_data = get(url=str(image)).content
+        image_data = _download_session().get(url=str(image)).content
     return upload_image_raw(client, image_data)['url']
 
 
-def parse_date(date_str: Optional[str], date_only=False) -> Optional[Union[datetime, date]]:
+def json_dumps(obj) -> bytes:
+    """
+    Serialize ``obj`` to UTF-8 json ``bytes``, with ``orjson`` if installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def json_loads(data: Union[bytes, str]) -> Union[dict, list]:
+    """
+    Deserialize json ``bytes`` or ``str``, with ``orjson`` if installed.
+        - Raises :py:exc:`json.JSONDecodeError` on invalid json in both cases.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return loads(data)
+
+
+@lru_cache(maxsize=4096)
+def parse_date(date_str: Optional[Union[str, date]], date_only=False) -> Optional[Union[datetime, date]]:
+    """
+    Parse api date string (``2022-06-25T22:28:41Z`` or ``2022-06-25`` with ``date_only``).
+        - Memoized: the same dates repeat a lot in lists (comments, watchers, calls etc.). the returned objects are immutable.
+    """
     if date_str is None:
         return date_str
-    date_obj = datetime.strptime(str(date_str), '%Y-%m-%d' + ('' if date_only else 'T%H:%M:%S%z'))
+    if isinstance(date_str, date):  # already parsed (datetime is a subclass of date)
+        return date_str.date() if date_only and isinstance(date_str, datetime) else date_str
+    date_str = str(date_str)
+    try:  # fromisoformat is much faster than strptime, but before python 3.11 it doesn't accept the 'Z' suffix.
+        if date_only:
+            return date.fromisoformat(date_str)
+        if date_str.endswith('Z'):
+            date_obj = datetime.fromisoformat(date_str[:-1] + '+00:00')
+            if date_obj.tzinfo is not None:
+                return date_obj
+    except ValueError:
+        pass
+    date_obj = datetime.strptime(date_str, '%Y-%m-%d' + ('' if date_only else 'T%H:%M:%S%z'))
     return date_obj.date() if date_only else date_obj
 
 
+def intern_str(value: Optional[str]) -> Optional[str]:
+    """
+    Intern api values with a few possible values (``status``, ``category``, ``gender`` etc.).
+        - Large lists of models share one string object per value instead of a copy per object.
+    """
+    return intern(value) if type(value) is str else value
+
+
 def get_img_binary_content(img_url: str) -> Optional[str]:
     try:
-        res = get(img_url)
-        if res.status_code == 200:
-            return b64encode(res.content).decode("utf-8")
+        with _download_session().get(img_url, stream=True) as res:
+            if res.status_code == 200:
+                # encode while downloading, the raw image and its base64 copy are never kept in memory together.
+                encoded, tail = bytearray(), b''
+                for chunk in res.iter_content(chunk_size=_IMG_CHUNK_SIZE):
+                    data = tail + chunk
+                    cut = len(data) - len(data) % 3  # base64 encodes 3 bytes at a time, keep the rest for the next chunk
+                    encoded += b64encode(data[:cut])
+                    tail = data[cut:]
+                encoded += b64encode(tail)
+                return encoded.decode("ascii")
     except:
         return None
 
 
+def get_img_binary_contents(img_urls: Iterable[str], max_workers: int = 8) -> Dict[str, Optional[str]]:
+    """
+    Download many images concurrently, the same as :py:func:`get_img_binary_content` on each unique url.
+    """
+    img_urls = list(dict.fromkeys(img_urls))  # unique, keeps the order
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(img_urls, executor.map(get_img_binary_content, img_urls)))
+
+
 def encode_string(string: str) -> str:
-    return encodestring(string.encode('utf-8')).decode("utf-8")
+    return b2a_qp(string.encode("utf-8")).decode("utf-8")  # the C encoder that quopri.encodestring wraps
+
+
+@lru_cache(maxsize=1)
+def _random_date_range(year: int) -> Tuple[int, int]:
+    """
+    Internal function to get the start timestamp and the length in seconds of the :py:func:`_random_date` range.
+        - Computed once per year.
+    """
+    start = int(datetime(year - 2, 5, 12, 0, 0, 11, tzinfo=timezone.utc).timestamp())
+    end = int(datetime(year, 6, 24, 0, 0, 11, tzinfo=timezone.utc).timestamp())
+    return start, end - start
 
 
 def _random_date():
-    current_year = date.today().year
-    start, end, date_format = f'{current_year - 2}-05-12T00:00:11Z', f'{current_year}-06-24T00:00:11Z', '%Y-%m-%dT%H:%M:%S%z'
-    try:
-        stime = mktime(strptime(start, date_format))
-        etime = mktime(strptime(end, date_format))
-        ptime = stime + random() * (etime - stime)
-        return datetime.strptime(strftime(date_format, localtime(ptime)), date_format).strftime(date_format)
-    except ValueError:
-        return choice([start, end])
+    start, span = _random_date_range(date.today().year)
+    return strftime('%Y-%m-%dT%H:%M:%S%z', localtime(start + int(random() * span)))
+
+
+@lru_cache(maxsize=1)
+def _get_random_numbers_and_names(size: int = 50) -> Tuple[Tuple[int, ...], Tuple[str, ...]]:
+    """
+    Internal function to download pools of random phone numbers and names.
+        - Downloaded once per process, :py:func:`generate_random_data` picks from them on every call.
+    """
+    session = _download_session()
+    with ThreadPoolExecutor(max_workers=2) as executor:  # two independent requests, send them together.
+        phones_res = executor.submit(session.get, url=f'{RANDOM_API}/phone_number/random_phone_number?size={size}')
+        names_res = executor.submit(session.get, url=f'{RANDOM_API}/name/random_name?size={size}')
+        numbers = tuple(int(_NON_DIGITS_RE.sub('', str(phone['phone_number']))) for phone in phones_res.result().json())
+        names = tuple(str(name['name']) for name in names_res.result().json())
+    return numbers, names
 
 
 def generate_random_data(contacts=True, calls=True, location=True) -> dict:
     if not contacts and not calls and not location:
         raise MeException("You need to set True at least one of the random data types")
 
-    call_types = ['missed', 'outgoing', 'incoming']
+    call_types = ('missed', 'outgoing', 'incoming')
     random_data = {}
 
     if contacts or calls:
         count = randint(30, 50)
-        random_numbers = [phone['phone_number'] for phone in get(url=RANDOM_API+f'/phone_number/random_phone_number?size={count}"').json()]
-        random_names = [name['name'] for name in get(url=RANDOM_API+f'/name/random_name?size={count}').json()]
+        random_numbers, random_names = _get_random_numbers_and_names()
+
+        # the same picks serve both lists, the calls are from the uploaded contacts.
+        picks = list(zip(choices(random_names, k=count), choices(random_numbers, k=count)))
 
         if contacts:
-            random_data['contacts'] = []
-            for contact in range(1, count + 1):
-                random_data['contacts'].append({
-                    "country_code": "XX",
-                    "date_of_birth": None,
-                    "name": str(choice(random_names)),
-                    "phone_number": int(sub(r'\D', '', str(choice(random_numbers))))
-                })
+            random_data['contacts'] = [{
+                "country_code": "XX",
+                "date_of_birth": None,
+                "name": name,
+                "phone_number": phone_number
+            } for name, phone_number in picks]
 
         if calls:
-            random_data['calls'] = []
-            for call in range(1, count + 1):
-                random_data['calls'].append({
-                    "called_at": _random_date(),
-                    "duration": randint(10, 300),
-                    "name": str(choice(random_names)),
-                    "phone_number": int(sub(r'\D', '', str(choice(random_numbers)))),
-                    "tag": None,
-                    "type": choice(call_types)
-                })
+            random_data['calls'] = [{
+                "called_at": _random_date(),
+                "duration": randint(10, 300),
+                "name": name,
+                "phone_number": phone_number,
+                "tag": None,
+                "type": call_type
+            } for (name, phone_number), call_type in zip(picks, choices(call_types, k=count))]
 
     if location:
         random_data['location'] = {}
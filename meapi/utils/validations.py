@@ -1,45 +1,64 @@
+from functools import lru_cache
 from random import randint
-from re import match, sub
-from typing import Union, List
+from re import compile
+from typing import Union, List, Optional, Iterable, Iterator
 from meapi.utils.exceptions import MeException
 
+_CALL_TYPES = frozenset(('incoming', 'missed', 'outgoing'))
+_NON_DIGITS_RE = compile(r'\D')
+_PHONE_NUMBER_RE = compile(r'\d{9,15}')
 
-def validate_contacts(contacts: List[dict]) -> List[dict]:
+
+def iter_valid_contacts(contacts: Iterable[dict]) -> Iterator[dict]:
     """
-    Gets list of dict of contacts and return the valid contacts in the same format. to use of add_contacts and remove_contacts methods
+    Lazily yield the valid contacts from any iterable of contacts (list, generator, file reader etc.).
     """
-    contacts_list = []
     for con in contacts:
-        if isinstance(con, dict):
-            if con.get('name') and con.get('phone_number'):
-                contacts_list.append(con)
+        if isinstance(con, dict) and con.get('name') and con.get('phone_number'):
+            yield con
+
+
+def validate_contacts(contacts: Iterable[dict]) -> List[dict]:
+    """
+    Gets list of dict of contacts and return the valid contacts in the same format. to use of add_contacts and remove_contacts methods
+        - ``contacts`` can be any iterable, it is consumed once and materialized only here, where the request body needs a list.
+    """
+    contacts_list = list(iter_valid_contacts(contacts))
     if not contacts_list:
         raise MeException("Valid contacts not found! check this example for valid contact syntax: "
                           "https://gist.github.com/david-lev/b158f1cc0cc783dbb13ff4b54416ceec#file-contacts-py")
     return contacts_list
 
 
-def validate_calls(calls: List[dict]) -> List[dict]:
+def iter_valid_calls(calls: Iterable[dict]) -> Iterator[dict]:
     """
-    Gets list of dict of calls and return the valid calls in the same format. to use of add_calls_to_log and remove_calls_from_log methods
+    Lazily yield the valid calls from any iterable of calls, filling the missing fields with defaults.
     """
-    calls_list = []
     for cal in calls:
         if isinstance(cal, dict):
-            if not cal.get('name') or not cal.get('phone_number'):
-                if cal.get('phone_number'):
-                    cal['name'] = str(cal.get('phone_number'))
-                else:
-                    raise MeException("Phone number must be provided!!")
-            if cal.get('type') not in ['incoming', 'missed', 'outgoing']:
-                raise MeException("No such call type as " + str(cal.get('type')) + "!")
-            if not cal.get('duration'):
+            get = cal.get
+            phone_number = get('phone_number')
+            if not phone_number:
+                raise MeException("Phone number must be provided!!")
+            if not get('name'):
+                cal['name'] = str(phone_number)
+            if get('type') not in _CALL_TYPES:
+                raise MeException("No such call type as " + str(get('type')) + "!")
+            if not get('duration'):
                 cal['duration'] = randint(10, 300)
-            if not cal.get('tag'):
+            if not get('tag'):
                 cal['tag'] = None
-            if not cal.get('called_at'):
+            if not get('called_at'):
                 cal['called_at'] = f"{randint(2018, 2022)}-{randint(1, 12)}-{randint(1, 31)}T{randint(1, 23)}:{randint(10, 59)}:{randint(10, 59)}Z"
-            calls_list.append(cal)
+            yield cal
+
+
+def validate_calls(calls: Iterable[dict]) -> List[dict]:
+    """
+    Gets list of dict of calls and return the valid calls in the same format. to use of add_calls_to_log and remove_calls_from_log methods
+        - ``calls`` can be any iterable, it is consumed once and materialized only here, where the request body needs a list.
+    """
+    calls_list = list(iter_valid_calls(calls))
     if not calls_list:
         raise MeException("Valid calls not found! check this example for valid call syntax: "
                           "https://gist.github.com/david-lev/b158f1cc0cc783dbb13ff4b54416ceec#file-calls_log-py")
@@ -58,10 +77,25 @@ def validate_phone_number(phone_number: Union[str, int]) -> int:
     :rtype: int
     """
     if phone_number:
-        phone_number = sub(r'[\D]', '', str(phone_number))
-        if match(r"^\d{9,15}$", phone_number):
-            return int(phone_number)
-    raise MeException("Not a valid phone number! " + phone_number)
+        try:
+            clean_phone_number = _normalize_phone_number(phone_number)
+        except TypeError:  # unhashable (list, dict etc.), can't be memoized and can't be a phone number
+            clean_phone_number = None
+        if clean_phone_number is not None:
+            return clean_phone_number
+    raise MeException("Not a valid phone number! " + str(phone_number))
+
+
+@lru_cache(maxsize=4096)
+def _normalize_phone_number(phone_number: Union[str, int]) -> Optional[int]:
+    """
+    Internal function to clean phone number and return it as ``int``, or ``None`` if not valid.
+        - Memoized: the same numbers are validated over and over (search, block, friendship etc.).
+    """
+    phone_number = _NON_DIGITS_RE.sub('', str(phone_number))
+    if _PHONE_NUMBER_RE.fullmatch(phone_number):
+        return int(phone_number)
+    return None
 
 
 def validate_auth_response(auth_data: dict) -> dict:
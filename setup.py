@@ -28,4 +28,5 @@ setup(
     author='David Lev',
     license='MIT',
     install_requires=['requests'],
+    extras_require={'orjson': ['orjson']},
 )